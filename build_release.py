@@ -11,16 +11,26 @@ Usage:
     python build_release.py                  # Build everything
     python build_release.py --exe-only       # Build only single .exe
     python build_release.py --portable-only  # Build only portable ZIP
+    python build_release.py --zstd           # Zstandard-compressed portable ZIP (Python 3.14+)
+    python build_release.py --force          # Rebuild even if sources are unchanged
 """
 
 import os
+import re
 import sys
+import time
+import fnmatch
+import zlib
 import shutil
 import zipfile
 import subprocess
 import json
 import hashlib
 import argparse
+import importlib.util
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -40,6 +50,17 @@ DIST_DIR = ROOT_DIR / "dist"
 BUILD_DIR = ROOT_DIR / "build"
 RELEASE_DIR = ROOT_DIR / "release"
 
+# Zstandard ZIP members (Python 3.14+). Opt-in only: Windows Explorer and
+# older unzip tools can't extract them.
+ZIP_ZSTD = getattr(zipfile, 'ZIP_ZSTD', None)
+
+# Files and directories that are never packaged or fingerprinted
+EXCLUDE_PATTERNS = [
+    '__pycache__', '.git', '.pytest_cache', '.mypy_cache', '.ruff_cache',
+    '*.pyc', '*.pyo', '*.log',
+]
+_EXCLUDE_RE = re.compile('|'.join(fnmatch.translate(p) for p in EXCLUDE_PATTERNS))
+
 
 def calculate_checksum(file_path: Path) -> str:
     """Calculate SHA256 checksum of a file."""
@@ -50,17 +71,325 @@ def calculate_checksum(file_path: Path) -> str:
     return sha256.hexdigest()
 
 
-def clean_directories():
-    """Clean build directories."""
+def _walk_files(root: Path):
+    """Yield (path, stat_result) for every packageable file under root.
+    
+    Uses os.scandir so each file's stat comes from the cached DirEntry, and
+    prunes excluded directories before they are ever opened.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if _EXCLUDE_RE.match(entry.name):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            else:
+                yield entry.path, entry.stat()
+
+
+def _scan_files(directory: Path, suffix: str = None) -> list:
+    """List (path, stat_result) for the files directly inside directory.
+    
+    One os.scandir pass; the type check and stat both come from the DirEntry.
+    """
+    if not directory.exists():
+        return []
+    with os.scandir(directory) as it:
+        files = [
+            (Path(entry.path), entry.stat())
+            for entry in it
+            if entry.is_file(follow_symlinks=False)
+            and (suffix is None or entry.name.endswith(suffix))
+        ]
+    return sorted(files, key=lambda item: item[0].name)
+
+
+def _tree_hash(roots, salt: str = "") -> str:
+    """Fingerprint a set of files/directories by path, size and mtime."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(VERSION.encode())
+    h.update(salt.encode())
+    for root in roots:
+        root = Path(root)
+        if root.is_file():
+            files = [(str(root), root.stat())]
+        elif root.is_dir():
+            files = _walk_files(root)
+        else:
+            continue
+        for path, st in files:
+            h.update(os.path.relpath(path, ROOT_DIR).encode())
+            h.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest()
+
+
+def _hash_sidecar(zip_path: Path) -> Path:
+    """Path of the .hash file recording which sources built zip_path."""
+    return zip_path.with_name(zip_path.name + ".hash")
+
+
+def _is_up_to_date(zip_path: Path, digest: str) -> bool:
+    """Check whether zip_path was already built from sources matching digest."""
+    sidecar = _hash_sidecar(zip_path)
+    if not zip_path.exists() or not sidecar.exists():
+        return False
+    return sidecar.read_text(encoding='utf-8').strip() == digest
+
+
+def _compress_one(path: str, level: int = 6):
+    """Deflate a single file (runs in a worker process for _parallel_zip).
+    
+    Returns (crc32, uncompressed_size, raw_deflate_bytes).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    # Raw DEFLATE stream (no zlib header) - exactly what a ZIP member stores
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zlib.crc32(data), len(data), compressed
+
+
+# Members at least this big are split into blocks and deflated on threads
+LARGE_MEMBER_SIZE = 4 << 20
+DEFLATE_BLOCK_SIZE = 1 << 20
+
+
+def _deflate_block(block: bytes, last: bool, level: int) -> bytes:
+    """Deflate one block independently, ending on a byte boundary."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    # Z_FULL_FLUSH resets back-references so blocks can be concatenated;
+    # only the final block terminates the stream
+    return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+
+
+def _compress_large(path: str, level: int = 6):
+    """Deflate one big file using MiGz-style parallel blocks.
+    
+    zlib releases the GIL, so threads scale across cores. The concatenated
+    blocks form a single valid raw-DEFLATE stream.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    offsets = range(0, len(data), DEFLATE_BLOCK_SIZE)
+    blocks = [data[i:i + DEFLATE_BLOCK_SIZE] for i in offsets]
+    last_flags = [i == len(blocks) - 1 for i in range(len(blocks))]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        compressed = b''.join(pool.map(_deflate_block, blocks, last_flags, [level] * len(blocks)))
+    return zlib.crc32(data), len(data), compressed
+
+
+def _deflated_zinfo(arcname: str, st: os.stat_result, crc: int, size: int,
+                    compressed: bytes) -> zipfile.ZipInfo:
+    """Build the ZipInfo for a member whose DEFLATE data is already computed."""
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(compressed)
+    return zinfo
+
+
+def _write_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, compressed: bytes):
+    """Append an already-deflated member to an open ZipFile.
+    
+    zipfile has no public API for adding pre-compressed data, so this is
+    the one place the build touches ZipFile internals. It mirrors what
+    ZipFile._open_to_write() and _ZipWriteFile.close() do for a member whose
+    CRC and sizes are known up front: it holds the archive lock, runs
+    _writecheck() (duplicate names, closed archive, ZIP64 limits) and
+    updates filelist/NameToInfo/start_dir so close() writes a valid central
+    directory. Checked against CPython 3.8-3.13; any new release must still
+    pass the round trip in test_build_readiness.py.
+    """
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    if zip64 and not zipf._allowZip64:
+        raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+    
+    with zipf._lock:
+        if zipf._writing:
+            raise ValueError("Can't write to the ZIP file while there is another write handle open on it")
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(compressed)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+# SHA256 of archives written during this run, computed as they were written
+_archive_checksums = {}
+
+
+class _HashingWriter:
+    """Write-through wrapper that SHA256-hashes every byte of a ZIP as it's written.
+    
+    It deliberately has no seek(), so ZipFile streams (using data
+    descriptors) instead of seeking back to patch headers - the hash then
+    matches the final file exactly.
+    """
+    
+    def __init__(self, fp):
+        self.fp = fp
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+    
+    def write(self, data) -> int:
+        self.fp.write(data)
+        self.sha256.update(data)
+        self.size += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self.size
+    
+    def flush(self):
+        self.fp.flush()
+
+
+def _open_zip_output(zip_path: Path):
+    """Open a ZIP destination with a 1 MiB write buffer.
+    
+    The default 8 KiB buffer means thousands of write syscalls for a large
+    archive. O_SEQUENTIAL (Windows only) hints the cache manager as well.
+    """
+    sequential = getattr(os, 'O_SEQUENTIAL', 0)
+    return open(zip_path, 'wb', buffering=1 << 20,
+                opener=lambda path, flags: os.open(path, flags | sequential))
+
+
+def _tree_members(src_dir: Path, arc_prefix: str) -> list:
+    """List (path, arcname, stat) for every packageable file under src_dir."""
+    return [
+        (path, f"{arc_prefix}/" + os.path.relpath(path, src_dir).replace(os.sep, '/'), st)
+        for path, st in _walk_files(src_dir)
+    ]
+
+
+def _file_member(path: Path, arcname: str) -> tuple:
+    """Describe a single on-disk file as a ZIP member."""
+    return str(path), arcname, path.stat()
+
+
+def _parallel_zip(zip_path: Path, members: list, generated: dict = None,
+                  compression: int = zipfile.ZIP_DEFLATED, compresslevel: int = 6):
+    """Write a ZIP straight from source files using all CPU cores.
+    
+    members are (path, arcname, stat) tuples read from their original
+    locations, and generated maps arcname -> text for files created by the
+    build, so nothing is staged on disk first. DEFLATE is the dominant cost
+    of packaging, so every member is compressed in a worker process and the
+    results are stitched into one archive here. Zstandard is fast enough on
+    its own and is written directly.
+    
+    compresslevel only applies to DEFLATE: 6 is zlib's balanced default,
+    9 squeezes out a few percent more for archives users download.
+    """
+    generated = generated or {}
+    
+    if compression != zipfile.ZIP_DEFLATED:
+        with _open_zip_output(zip_path) as raw:
+            writer = _HashingWriter(raw)
+            with zipfile.ZipFile(writer, 'w', compression, compresslevel=3) as zipf:
+                for path, arcname, _ in members:
+                    zipf.write(path, arcname)
+                for arcname, content in generated.items():
+                    zipf.writestr(arcname, content)
+        _archive_checksums[zip_path.name] = writer.sha256.hexdigest()
+        return
+    
+    pending = [path for path, _, st in members if st.st_size < LARGE_MEMBER_SIZE]
+    
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool, _open_zip_output(zip_path) as raw:
+        writer = _HashingWriter(raw)
+        with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
+            chunksize = max(1, len(pending) // ((os.cpu_count() or 1) * 4))
+            results = pool.map(_compress_one, pending, [compresslevel] * len(pending), chunksize=chunksize)
+            for path, arcname, st in members:
+                if st.st_size < LARGE_MEMBER_SIZE:
+                    crc, size, compressed = next(results)
+                else:
+                    crc, size, compressed = _compress_large(path, compresslevel)
+                _write_precompressed(zipf, _deflated_zinfo(arcname, st, crc, size, compressed), compressed)
+            for arcname, content in generated.items():
+                zipf.writestr(arcname, content)
+    _archive_checksums[zip_path.name] = writer.sha256.hexdigest()
+
+
+def _text_member(content: str) -> str:
+    """Use platform line endings, matching what a text-mode file write produced."""
+    return content.replace('\n', os.linesep)
+
+
+# Background deletions started by clean_directories, joined before exit
+_cleanup_threads = []
+
+
+def _fast_rmtree(directory: Path):
+    """Delete a directory tree, ignoring errors.
+    
+    On Windows the native rmdir is much faster than shutil.rmtree for wide
+    trees (same reason robocopy beats copytree).
+    """
+    if sys.platform == 'win32':
+        subprocess.run(['cmd', '/c', 'rmdir', '/S', '/Q', str(directory)], check=False,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _delete_in_background(directory: Path):
+    """Start deleting a directory tree on a background thread."""
+    thread = threading.Thread(target=_fast_rmtree, args=(directory,))
+    thread.start()
+    _cleanup_threads.append(thread)
+
+
+def _discard_directory(directory: Path):
+    """Move a directory out of the way and delete it on a background thread.
+    
+    The rename is O(1), so the build continues immediately instead of
+    waiting for rmtree of a large tree.
+    """
+    trash = directory.with_name(f".trash-{directory.name}-{time.time_ns()}")
+    os.rename(directory, trash)
+    _delete_in_background(trash)
+
+
+def clean_directories(force: bool = False):
+    """Clean build directories.
+    
+    With force=True the release hash sidecars are dropped as well, so every
+    package is rebuilt even if its sources are unchanged.
+    """
     print("🧹 Cleaning build directories...")
     
+    # Leftovers from a build that was interrupted mid-delete
+    for trash in ROOT_DIR.glob(".trash-*"):
+        _delete_in_background(trash)
+    
     for directory in [BUILD_DIR, DIST_DIR]:
         if directory.exists():
             print(f"   🗑️  Removing {directory.name}")
-            shutil.rmtree(directory)
+            _discard_directory(directory)
         else:
             print(f"   ✅ {directory.name} doesn't exist, skipping")
     
+    if force and RELEASE_DIR.exists():
+        for sidecar in RELEASE_DIR.glob("*.zip.hash"):
+            sidecar.unlink()
+        print("   🗑️  Invalidated cached release packages")
+    
     # Create fresh directories
     DIST_DIR.mkdir(parents=True, exist_ok=True)
     RELEASE_DIR.mkdir(parents=True, exist_ok=True)
@@ -81,12 +410,13 @@ def check_dependencies():
         'tqdm': 'tqdm (runtime dependency)',
     }
     
+    # find_spec only locates the module - importing PyInstaller & co. just
+    # to prove they exist costs more than the check is worth
     missing = []
     for module, description in dependencies.items():
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"   ✅ {description}")
-        except ImportError:
+        else:
             print(f"   ❌ {description} - MISSING")
             missing.append(module)
     
@@ -100,7 +430,7 @@ def check_dependencies():
     return True
 
 
-def build_single_exe():
+async def build_single_exe():
     """Build single-file executable using PyInstaller."""
     print("🚀 Building single-file executable with PyInstaller...")
     print("   This may take 2-5 minutes depending on your system...")
@@ -118,12 +448,22 @@ def build_single_exe():
         str(spec_file)
     ]
     
-    print(f"   🔄 Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Stream PyInstaller output to a log file instead of buffering it in pipes
+    BUILD_DIR.mkdir(exist_ok=True)
+    log_path = BUILD_DIR / "pyinstaller.log"
     
-    if result.returncode != 0:
-        print(f"   ❌ PyInstaller failed:")
-        print(result.stderr)
+    print(f"   🔄 Running: {' '.join(cmd)}")
+    print(f"   📝 Log: {log_path}")
+    with open(log_path, 'wb') as log:
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=log, stderr=asyncio.subprocess.STDOUT
+        )
+        await process.wait()
+    
+    if process.returncode != 0:
+        print(f"   ❌ PyInstaller failed (last lines of {log_path.name}):")
+        lines = log_path.read_text(errors='replace').splitlines()
+        print("\n".join(lines[-40:]))
         return False
     
     # Check if EXE was created
@@ -139,32 +479,11 @@ def build_single_exe():
     return True
 
 
-def create_portable_package():
+def create_portable_package(compression: int = zipfile.ZIP_DEFLATED):
     """Create portable ZIP package with source code and launcher."""
     print("📦 Creating portable package...")
     
-    # Create portable directory
-    portable_dir = RELEASE_DIR / f"{PROJECT_NAME}_v{VERSION}_Portable"
-    if portable_dir.exists():
-        shutil.rmtree(portable_dir)
-    portable_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Copy main runner
-    runner_file = ROOT_DIR / "ngio_automation_runner.py"
-    shutil.copy2(runner_file, portable_dir / "ngio_automation_runner.py")
-    print("   📄 Copied ngio_automation_runner.py")
-    
-    # Copy source directory
-    shutil.copytree(SRC_DIR, portable_dir / "src", dirs_exist_ok=True)
-    print("   📁 Copied src/ directory")
-    
-    # Copy documentation
-    docs_dir = ROOT_DIR / "docs"
-    if docs_dir.exists():
-        shutil.copytree(docs_dir, portable_dir / "docs", dirs_exist_ok=True)
-        print("   📁 Copied docs/ directory")
-    
-    # Copy essential files
+    zip_path = RELEASE_DIR / f"{PROJECT_NAME}_v{VERSION}_Portable.zip"
     essential_files = [
         "README.md",
         "LICENSE",
@@ -172,11 +491,38 @@ def create_portable_package():
         "run_ngio_automation.bat"
     ]
     
+    # Skip the rebuild entirely if nothing that goes into the ZIP changed
+    sources = [
+        ROOT_DIR / "ngio_automation_runner.py", SRC_DIR, ROOT_DIR / "docs",
+        Path(__file__), *(ROOT_DIR / name for name in essential_files)
+    ]
+    digest = _tree_hash(sources, salt=str(compression))
+    if _is_up_to_date(zip_path, digest):
+        print(f"   ✅ {zip_path.name} is up to date, skipping")
+        return zip_path
+    
+    package_name = f"{PROJECT_NAME}_v{VERSION}_Portable"
+    
+    # Main runner
+    members = [_file_member(ROOT_DIR / "ngio_automation_runner.py", f"{package_name}/ngio_automation_runner.py")]
+    print("   📄 Added ngio_automation_runner.py")
+    
+    # Source directory
+    members += _tree_members(SRC_DIR, f"{package_name}/src")
+    print("   📁 Added src/ directory")
+    
+    # Documentation
+    docs_dir = ROOT_DIR / "docs"
+    if docs_dir.exists():
+        members += _tree_members(docs_dir, f"{package_name}/docs")
+        print("   📁 Added docs/ directory")
+    
+    # Essential files
     for filename in essential_files:
         src_file = ROOT_DIR / filename
         if src_file.exists():
-            shutil.copy2(src_file, portable_dir / filename)
-            print(f"   📄 Copied {filename}")
+            members.append(_file_member(src_file, f"{package_name}/{filename}"))
+            print(f"   📄 Added {filename}")
     
     # Create portable launcher (with Python check)
     launcher_content = '''@echo off
@@ -220,7 +566,7 @@ python -c "import psutil, colorama, yaml, tqdm" >nul 2>&1
 if %errorlevel% neq 0 (
     echo.
     echo Some dependencies are missing. Installing...
-    python -m pip install -r requirements.txt
+    python -m pip install --disable-pip-version-check --prefer-binary -r requirements.txt
     if %errorlevel% neq 0 (
         echo.
         echo Failed to install dependencies!
@@ -243,8 +589,7 @@ echo.
 pause
 '''.format(version=VERSION)
     
-    with open(portable_dir / "run_portable.bat", "w", encoding='utf-8') as f:
-        f.write(launcher_content)
+    generated = {f"{package_name}/run_portable.bat": _text_member(launcher_content)}
     print("   📄 Created run_portable.bat")
     
     # Create README for portable version
@@ -303,34 +648,18 @@ For issues, suggestions, or questions:
 - Prefer running scripts directly vs. executables
 '''
     
-    with open(portable_dir / "README_PORTABLE.txt", "w", encoding='utf-8') as f:
-        f.write(portable_readme)
+    generated[f"{package_name}/README_PORTABLE.txt"] = _text_member(portable_readme)
     print("   📄 Created README_PORTABLE.txt")
     
     # Create ZIP archive
-    zip_path = RELEASE_DIR / f"{PROJECT_NAME}_v{VERSION}_Portable.zip"
     print(f"   🔄 Creating ZIP archive...")
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(portable_dir):
-            # Skip __pycache__ directories
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            
-            for file in files:
-                # Skip .pyc files
-                if file.endswith('.pyc'):
-                    continue
-                    
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(portable_dir.parent)
-                zipf.write(file_path, arcname)
+    _parallel_zip(zip_path, members, generated, compression)
+    _hash_sidecar(zip_path).write_text(digest, encoding='utf-8')
     
     size_mb = zip_path.stat().st_size / 1024 / 1024
     print(f"   ✅ Created: {zip_path.name} ({size_mb:.1f} MB)")
     
-    # Clean up extracted directory
-    shutil.rmtree(portable_dir)
-    
     return zip_path
 
 
@@ -339,27 +668,29 @@ def create_final_release_package():
     print("📦 Creating final release package...")
     
     release_name = f"{PROJECT_NAME}_v{VERSION}_Release"
-    release_dir = RELEASE_DIR / release_name
-    if release_dir.exists():
-        shutil.rmtree(release_dir)
-    release_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = RELEASE_DIR / f"{release_name}.zip"
     
-    # Copy EXE
+    sources = [DIST_DIR, ROOT_DIR / "docs", ROOT_DIR / "README.md", Path(__file__)]
+    digest = _tree_hash(sources)
+    if _is_up_to_date(zip_path, digest):
+        print(f"   ✅ {zip_path.name} is up to date, skipping")
+        return zip_path
+    
+    members = []
+    
+    # EXE
     exe_files = list(DIST_DIR.glob("*.exe"))
     if exe_files:
         exe_file = exe_files[0]
-        shutil.copy2(exe_file, release_dir / exe_file.name)
-        print(f"   📄 Copied {exe_file.name}")
+        members.append(_file_member(exe_file, f"{release_name}/{exe_file.name}"))
+        print(f"   📄 Added {exe_file.name}")
     else:
         print("   ⚠️ No .exe file found to include")
     
-    # Copy documentation
+    # Documentation
     docs_dir = ROOT_DIR / "docs"
     if docs_dir.exists():
-        target_docs = release_dir / "docs"
-        target_docs.mkdir(exist_ok=True)
-        
-        # Copy essential documentation only.
+        # Essential documentation only.
         # Release notes filename is derived from current VERSION so future
         # bumps don't require editing this script.
         release_notes_filename = f"V{VERSION}_RELEASE_NOTES.md"
@@ -372,8 +703,8 @@ def create_final_release_package():
         for doc in essential_docs:
             src_doc = docs_dir / doc
             if src_doc.exists():
-                shutil.copy2(src_doc, target_docs / doc)
-                print(f"   📄 Copied docs/{doc}")
+                members.append(_file_member(src_doc, f"{release_name}/docs/{doc}"))
+                print(f"   📄 Added docs/{doc}")
             elif doc == release_notes_filename:
                 # Don't fail the build if release notes are missing - warn
                 # the maintainer to write them, but ship the exe anyway.
@@ -382,11 +713,11 @@ def create_final_release_package():
                     f"create release notes before publishing!"
                 )
     
-    # Copy README
+    # README
     readme = ROOT_DIR / "README.md"
     if readme.exists():
-        shutil.copy2(readme, release_dir / "README.md")
-        print("   📄 Copied README.md")
+        members.append(_file_member(readme, f"{release_name}/README.md"))
+        print("   📄 Added README.md")
     
     # Create Quick Start guide
     quick_start = f'''# NGIO Automation Suite v{VERSION} - Quick Start
@@ -447,27 +778,19 @@ The tool will guide you through:
 Enjoy your automated grass cache generation! 🌱
 '''
     
-    with open(release_dir / "QUICK_START.txt", "w", encoding='utf-8') as f:
-        f.write(quick_start)
+    generated = {f"{release_name}/QUICK_START.txt": _text_member(quick_start)}
     print("   📄 Created QUICK_START.txt")
     
     # Create ZIP of final package
-    zip_path = RELEASE_DIR / f"{release_name}.zip"
     print(f"   🔄 Creating final release ZIP...")
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(release_dir):
-            for file in files:
-                file_path = Path(root) / file
-                arcname = file_path.relative_to(release_dir.parent)
-                zipf.write(file_path, arcname)
+    # The EXE release is the main user download - spend the extra CPU on level 9
+    _parallel_zip(zip_path, members, generated, compresslevel=9)
+    _hash_sidecar(zip_path).write_text(digest, encoding='utf-8')
     
     size_mb = zip_path.stat().st_size / 1024 / 1024
     print(f"   ✅ Created: {zip_path.name} ({size_mb:.1f} MB)")
     
-    # Clean up extracted directory
-    shutil.rmtree(release_dir)
-    
     return zip_path
 
 
@@ -486,9 +809,11 @@ def create_release_info():
     }
     
     # Process all release files
-    for file in sorted(RELEASE_DIR.glob("*.zip")):
-        size_mb = file.stat().st_size / 1024 / 1024
-        checksum = calculate_checksum(file)
+    for file, st in _scan_files(RELEASE_DIR, ".zip"):
+        size_mb = st.st_size / 1024 / 1024
+        # Archives built this run were hashed while being written; only
+        # cached (skipped) packages need to be read back
+        checksum = _archive_checksums.get(file.name) or calculate_checksum(file)
         
         file_type = "unknown"
         if "Portable" in file.name:
@@ -506,10 +831,10 @@ def create_release_info():
         release_info["checksums"][file.name] = checksum
     
     # Add standalone EXE if exists
-    exe_files = list(DIST_DIR.glob("*.exe"))
+    exe_files = _scan_files(DIST_DIR, ".exe")
     if exe_files:
-        exe_file = exe_files[0]
-        size_mb = exe_file.stat().st_size / 1024 / 1024
+        exe_file, st = exe_files[0]
+        size_mb = st.st_size / 1024 / 1024
         checksum = calculate_checksum(exe_file)
         
         release_info["files"].append({
@@ -522,15 +847,30 @@ def create_release_info():
         
         release_info["checksums"][exe_file.name] = checksum
     
-    # Write release info
+    # Skip rewriting when the packaged files are identical to the last run,
+    # which also keeps build_date stable for downstream caches
     info_path = RELEASE_DIR / "release_info.json"
+    checksums_path = RELEASE_DIR / "CHECKSUMS_SHA256.txt"
+    key = hashlib.sha1(
+        (json.dumps(release_info["files"], sort_keys=True) + VERSION).encode()
+    ).hexdigest()
+    if info_path.exists() and checksums_path.exists():
+        try:
+            with open(info_path, 'r', encoding='utf-8') as f:
+                if json.load(f).get("_key") == key:
+                    print(f"   ✅ {info_path.name} is up to date, skipping")
+                    return
+        except (OSError, ValueError):
+            pass
+    release_info["_key"] = key
+    
+    # Write release info
     with open(info_path, 'w', encoding='utf-8') as f:
         json.dump(release_info, f, indent=2)
     
     print(f"   ✅ Created {info_path.name}")
     
     # Also create human-readable checksums file
-    checksums_path = RELEASE_DIR / "CHECKSUMS_SHA256.txt"
     with open(checksums_path, 'w', encoding='utf-8') as f:
         f.write(f"# SHA256 Checksums - {PROJECT_NAME} v{VERSION}\n")
         f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
@@ -540,11 +880,34 @@ def create_release_info():
     print(f"   ✅ Created {checksums_path.name}")
 
 
+async def build_exe_release():
+    """Build the single .exe and wrap it in the final release package."""
+    if not await build_single_exe():
+        raise Exception("EXE build failed")
+    await asyncio.get_running_loop().run_in_executor(None, create_final_release_package)
+
+
+async def build_all_packages(compression: int = zipfile.ZIP_DEFLATED):
+    """Build the EXE release and the portable package concurrently.
+    
+    PyInstaller runs as an asyncio subprocess while the portable package is
+    zipped on a worker thread (its DEFLATE work happens in _parallel_zip's
+    process pool). Wall time becomes max(step) instead of sum(step).
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        build_exe_release(),
+        loop.run_in_executor(None, create_portable_package, compression),
+    )
+
+
 def main():
     """Main build process."""
     parser = argparse.ArgumentParser(description="Build NGIO Automation Suite releases")
     parser.add_argument('--exe-only', action='store_true', help='Build only single .exe')
     parser.add_argument('--portable-only', action='store_true', help='Build only portable ZIP')
+    parser.add_argument('--zstd', action='store_true', help='Compress the portable ZIP with Zstandard (Python 3.14+)')
+    parser.add_argument('--force', action='store_true', help='Rebuild packages even if sources are unchanged')
     args = parser.parse_args()
     
     print(f"🚀 NGIO Automation Suite - Enhanced Build System v{VERSION}")
@@ -554,6 +917,14 @@ def main():
     print("=" * 80)
     print()
     
+    compression = zipfile.ZIP_DEFLATED
+    if args.zstd:
+        if ZIP_ZSTD is None:
+            print("⚠️ --zstd requires Python 3.14+, falling back to DEFLATE")
+            print()
+        else:
+            compression = ZIP_ZSTD
+    
     try:
         # Step 1: Check dependencies
         if not check_dependencies():
@@ -562,34 +933,23 @@ def main():
         print()
         
         # Step 2: Clean directories
-        clean_directories()
+        clean_directories(force=args.force)
         print()
         
         # Step 3: Build based on arguments
         if args.portable_only:
             print("📦 Building portable package only...")
-            create_portable_package()
+            create_portable_package(compression)
         elif args.exe_only:
             print("🚀 Building single .exe only...")
-            if not build_single_exe():
-                raise Exception("EXE build failed")
-            create_final_release_package()
+            asyncio.run(build_exe_release())
         else:
             # Build everything
             print("🎯 Building all release packages...")
             print()
             
-            # Build single EXE
-            if not build_single_exe():
-                raise Exception("EXE build failed")
-            print()
-            
-            # Create final release package
-            create_final_release_package()
-            print()
-            
-            # Create portable package
-            create_portable_package()
+            # EXE release and portable package share no state - build them concurrently
+            asyncio.run(build_all_packages(compression))
             print()
         
         # Step 4: Create release information
@@ -604,12 +964,11 @@ def main():
         
         # List all release files
         print("📦 Release files created:")
-        release_files = sorted(RELEASE_DIR.glob("*"))
         total_size = 0
         
-        for file_path in release_files:
-            if file_path.is_file():
-                size_mb = file_path.stat().st_size / 1024 / 1024
+        for file_path, st in _scan_files(RELEASE_DIR):
+            if file_path.suffix != ".hash":
+                size_mb = st.st_size / 1024 / 1024
                 total_size += size_mb
                 
                 icon = "📄"
@@ -625,9 +984,8 @@ def main():
         # Show EXE in dist folder too
         print()
         print("📦 Executable (dist/):")
-        exe_files = list(DIST_DIR.glob("*.exe"))
-        for exe_file in exe_files:
-            size_mb = exe_file.stat().st_size / 1024 / 1024
+        for exe_file, st in _scan_files(DIST_DIR, ".exe"):
+            size_mb = st.st_size / 1024 / 1024
             total_size += size_mb
             print(f"   🚀 {exe_file.name} ({size_mb:.1f} MB)")
         
@@ -649,6 +1007,9 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        for thread in _cleanup_threads:
+            thread.join()
 
 
 if __name__ == "__main__":
@@ -68,6 +68,16 @@ a = Analysis(
         'tkinter',
         'unittest',
         'test',
+        # Stdlib pieces the suite never uses - the embeddable-Python subset
+        'idlelib',
+        'turtle',
+        'turtledemo',
+        'lib2to3',
+        'ensurepip',
+        'pydoc_data',
+        'sqlite3',
+        'xmlrpc',
+        'curses',
         # Note: distutils removed - causes conflicts with Python 3.12+ and PyInstaller hooks
     ],
     win_no_prefer_redirects=False,
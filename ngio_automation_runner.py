@@ -14,9 +14,12 @@ import signal
 import atexit
 import argparse
 import time
+import threading
+import functools
+import importlib.util
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 print("[DEBUG] Basic imports done", flush=True)
 
@@ -24,9 +27,10 @@ print("[DEBUG] Basic imports done", flush=True)
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / "src"))
 
-print("[DEBUG] About to import automation_suite...", flush=True)
-from src.core.automation_suite import NGIOAutomationSuite, AutomationConfig, Season
-print("[DEBUG] automation_suite imported", flush=True)
+# automation_suite pulls in every core module - it's imported lazily where
+# generation actually starts so the banner and menu appear immediately
+if TYPE_CHECKING:
+    from src.core.automation_suite import AutomationConfig
 
 print("[DEBUG] About to import config_cache...", flush=True)
 from src.utils.config_cache import ConfigCache
@@ -44,17 +48,14 @@ print("[DEBUG] About to import version...", flush=True)
 from src.__version__ import __version__, __title__, __description__
 print("[DEBUG] All imports complete!", flush=True)
 
-# Import dependencies at module level (faster than in function)
+# Check dependencies at module level - find_spec only locates the modules,
+# it doesn't pay for importing them
 print("[DEBUG] Checking dependencies...", flush=True)
-try:
-    import psutil
-    import colorlog
-    import configparser
-    DEPENDENCIES_OK = True
-    print("[DEBUG] Dependencies OK", flush=True)
-except ImportError:
-    DEPENDENCIES_OK = False
-    print("[DEBUG] Dependencies MISSING", flush=True)
+DEPENDENCIES_OK = all(
+    importlib.util.find_spec(module) is not None
+    for module in ('psutil', 'colorlog', 'configparser')
+)
+print(f"[DEBUG] Dependencies {'OK' if DEPENDENCIES_OK else 'MISSING'}", flush=True)
 
 # Cache platform check at module level
 # WORKAROUND: platform.system() can hang for 2+ minutes on some systems!
@@ -139,7 +140,7 @@ For more information, visit: https://github.com/ReidenXerx/NGIO_AutomationSuite
     return parser.parse_args()
 
 
-def _apply_cli_overrides(automation_config: AutomationConfig, args) -> AutomationConfig:
+def _apply_cli_overrides(automation_config: 'AutomationConfig', args) -> 'AutomationConfig':
     """Apply runtime CLI flags to an already-built AutomationConfig in place."""
     if args is None:
         return automation_config
@@ -149,6 +150,16 @@ def _apply_cli_overrides(automation_config: AutomationConfig, args) -> Automatio
     return automation_config
 
 
+@functools.lru_cache(maxsize=None)
+def _season_map() -> dict:
+    """Map season display names ("Winter", "No Seasons", ...) to Season members.
+    
+    Built once on first use - Season lives in the lazily imported automation_suite.
+    """
+    from src.core.automation_suite import Season
+    return {season.display_name: season for season in Season}
+
+
 def print_banner():
     """Display the application banner"""
     # Enhanced banner with more info (v1.4.0+)
@@ -234,6 +245,8 @@ def show_main_menu(config_cache: ConfigCache) -> str:
 
 def handle_grass_generation(config_cache: ConfigCache, args=None) -> bool:
     """Handle the grass cache generation process"""
+    from src.core.automation_suite import NGIOAutomationSuite, AutomationConfig
+    
     logger = Logger("Generation")
     
     # Validate configuration
@@ -330,18 +343,11 @@ def handle_grass_generation(config_cache: ConfigCache, args=None) -> bool:
     preferences = config_cache.get_preferences()
     
     # Convert season names to Season enums
-    season_map = {
-        "Winter": Season.WINTER,
-        "Spring": Season.SPRING, 
-        "Summer": Season.SUMMER,
-        "Autumn": Season.AUTUMN,
-        "No Seasons": Season.NO_SEASONS
-    }
-    
-    seasons_to_generate = []
-    for season_name in preferences.seasons_to_generate:
-        if season_name in season_map:
-            seasons_to_generate.append(season_map[season_name])
+    season_map = _season_map()
+    seasons_to_generate = [
+        season for season in (season_map.get(name) for name in preferences.seasons_to_generate)
+        if season is not None
+    ]
     
     # Validate season selection
     if not seasons_to_generate:
@@ -439,10 +445,16 @@ def handle_grass_generation(config_cache: ConfigCache, args=None) -> bool:
     try:
         automation_suite = NGIOAutomationSuite(automation_config)
         
-        # Set global reference for signal handlers
+        # Set global reference for signal handlers; atexit cleanup is only
+        # needed while a run is in flight
         globals()['automation_suite'] = automation_suite
+        atexit.register(emergency_shutdown)
         success = automation_suite.run_full_automation()
         
+        # Finished normally - nothing left to preserve at exit
+        atexit.unregister(emergency_shutdown)
+        globals()['automation_suite'] = None
+        
         if success:
             logger.separator()
             logger.success("🎉 GRASS CACHE GENERATION COMPLETED SUCCESSFULLY!")
@@ -529,8 +541,16 @@ This tool can save the Skyrim modding community thousands of hours!
 # Global reference for signal handlers
 automation_suite = None
 
+# Set once emergency_shutdown has run - Ctrl+C triggers the signal handler
+# and then atexit via sys.exit, and the cleanup must only happen once
+_cleanup_done = threading.Event()
+
 def emergency_shutdown(signum=None, frame=None):
     """Handle emergency shutdown while preserving progress"""
+    if _cleanup_done.is_set():
+        return
+    _cleanup_done.set()
+    
     if automation_suite:
         try:
             print("\n🚨 Emergency shutdown - preserving progress...")
@@ -540,7 +560,7 @@ def emergency_shutdown(signum=None, frame=None):
     sys.exit(1)
 
 
-def create_automation_config_from_cache(config_cache: ConfigCache, grass_profile=None) -> AutomationConfig:
+def create_automation_config_from_cache(config_cache: ConfigCache, grass_profile=None) -> 'AutomationConfig':
     """
     Create AutomationConfig from cached configuration
     
@@ -551,22 +571,17 @@ def create_automation_config_from_cache(config_cache: ConfigCache, grass_profile
     Returns:
         AutomationConfig instance
     """
+    from src.core.automation_suite import AutomationConfig
+    
     paths = config_cache.get_paths()
     preferences = config_cache.get_preferences()
     
     # Convert season names to Season enums
-    season_map = {
-        "Winter": Season.WINTER,
-        "Spring": Season.SPRING, 
-        "Summer": Season.SUMMER,
-        "Autumn": Season.AUTUMN,
-        "No Seasons": Season.NO_SEASONS
-    }
-    
-    seasons_to_generate = []
-    for season_name in preferences.seasons_to_generate:
-        if season_name in season_map:
-            seasons_to_generate.append(season_map[season_name])
+    season_map = _season_map()
+    seasons_to_generate = [
+        season for season in (season_map.get(name) for name in preferences.seasons_to_generate)
+        if season is not None
+    ]
     
     # Use default LOD Compatible profile if none provided
     if grass_profile is None:
@@ -719,7 +734,6 @@ def main():
     print("[DEBUG] Registering signal handlers...", flush=True)
     signal.signal(signal.SIGINT, emergency_shutdown)  # Ctrl+C
     signal.signal(signal.SIGTERM, emergency_shutdown)  # Termination signal
-    atexit.register(emergency_shutdown)  # Normal exit
     print("[DEBUG] Signal handlers registered", flush=True)
     
     # Show banner unless suppressed
@@ -761,6 +775,7 @@ def main():
     # CLI MODE: If season argument provided, run generation directly
     if args.season:
         logger.info(f"🎯 CLI Mode: Generating {args.season} season")
+        from src.core.automation_suite import Season
         
         # Map season string to Season enum
         season_map = {
@@ -5,17 +5,330 @@ Creates installable mod archives for each season's grass cache
 """
 
 import os
+import zlib
 import shutil
 import zipfile
-import tempfile
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass
 import time
 
 from ..utils.logger import Logger
 
+# Zstandard members in .zip (method 93); stdlib zipfile supports it from Python 3.14
+ZIP_ZSTD = getattr(zipfile, 'ZIP_ZSTD', None)
+
+
+# Seasonal file tags (Foo.WIN.cgid); per-season output layouts also use them as folder names
+_SEASON_TAGS = ('WIN', 'SPR', 'SUM', 'AUT')
+
+
+def _season_skip_dirs(extensions) -> frozenset:
+    """Season folders (WIN/, SPR/, ...) that can't hold files with these extensions"""
+    tags = {ext[1:].split('.')[0] for ext in extensions}
+    if not tags <= set(_SEASON_TAGS):
+        return frozenset()  # plain .cgid files may live in any folder
+    return frozenset(_SEASON_TAGS) - tags
+
+
+# Head sample used to decide whether a grass file is worth deflating
+_COMPRESSIBILITY_SAMPLE_SIZE = 64 * 1024
+
+
+def _looks_incompressible(file_path: str) -> bool:
+    """True if a fast DEFLATE of the file's first 64 KiB saves less than 5%"""
+    with open(file_path, 'rb') as f:
+        sample = f.read(_COMPRESSIBILITY_SAMPLE_SIZE)
+    return not sample or len(zlib.compress(sample, 1)) > 0.95 * len(sample)
+
+
+def _write_member(zipf: zipfile.ZipFile, file_path: str, arcname: str) -> None:
+    """zipf.write(file_path, arcname), storing incompressible grass files as-is"""
+    # Grass cache payloads that don't compress are stored as-is - plain copy.
+    # Timestamp clamping comes from the archive's strict_timestamps=False.
+    if file_path.endswith('.cgid') and _looks_incompressible(file_path):
+        compress_type = zipfile.ZIP_STORED
+    else:
+        compress_type = zipf.compression
+    zipf.write(file_path, arcname, compress_type=compress_type)
+
+
+# Mod metadata templates - rendered with str.format per archive
+_README_TEMPLATE = """Grass Cache - {display_name} Season
+==================================================
+
+Generated by NGIO Automation Suite
+Creation Date: {timestamp}
+
+DESCRIPTION:
+This mod contains pre-generated grass cache files for the {display_name} season.
+These files enable high-performance grass rendering in Skyrim SE/AE/VR.
+
+CONTENTS:
+- {file_count} grass cache files ({extension})
+- Season Type: {season_type}
+
+REQUIREMENTS:
+- Skyrim SE/AE/VR
+- SKSE64
+- Grass Cache Helper NG (for seasonal switching)
+- Seasons of Skyrim (or compatible seasonal mod)
+
+INSTALLATION:
+1. Install this mod using your preferred mod manager (MO2, Vortex, etc.)
+2. Ensure Grass Cache Helper NG is installed and enabled
+3. Make sure NGIO is DISABLED (important!)
+4. Set your seasonal mod to use {display_name} season
+5. Launch Skyrim and enjoy improved grass performance!
+
+COMPATIBILITY:
+- Compatible with all grass mods
+- Compatible with ENB and weather mods
+- Works with landscape overhauls
+- May conflict with other grass cache mods (disable them)
+
+UNINSTALLATION:
+Simply disable or remove this mod through your mod manager.
+
+TROUBLESHOOTING:
+- If grass doesn't appear: Check that Grass Cache Helper NG is active
+- If performance is poor: Ensure NGIO is disabled
+- If crashes occur: Check for mod conflicts
+
+CREDITS:
+- NGIO Development Team: For the grass cache system
+- Grass Cache Helper NG: For seasonal cache loading
+- NGIO Automation Suite: For automated generation
+
+For support and updates, visit:
+https://github.com/ReidenXerx/ngio-automation-suite
+
+VERSION: 1.0
+LICENSE: Mod content follows original mod licenses
+"""
+
+_META_INI_TEMPLATE = """[General]
+modid=0
+version=1.0
+newestVersion=1.0
+category=23
+installationFile=Generated by NGIO Automation Suite
+
+[installedFiles]
+size=1
+
+[comments]
+Grass Cache for {display_name} Season
+Generated: {timestamp}
+Season Type: {season_type}
+Extension: {extension}
+"""
+
+_FOMOD_CONFIG_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<config xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="http://qconsulting.ca/fo3/ModConfig5.0.xsd">
+    <moduleName>Grass Cache - {display_name} Season</moduleName>
+    <installSteps>
+        <installStep name="Installation">
+            <optionalFileGroups>
+                <group name="Grass Cache Files" type="SelectExactlyOne">
+                    <plugins>
+                        <plugin name="Install {display_name} Grass Cache">
+                            <description>Installs pre-generated grass cache for {display_name} season.</description>
+                            <files>
+                                <folder source="Data" destination="Data" priority="0" />
+                            </files>
+                            <typeDescriptor>
+                                <type name="Recommended"/>
+                            </typeDescriptor>
+                        </plugin>
+                    </plugins>
+                </group>
+            </optionalFileGroups>
+        </installStep>
+    </installSteps>
+</config>"""
+
+_FOMOD_INFO_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<fomod>
+    <Name>Grass Cache - {display_name} Season</Name>
+    <Author>NGIO Automation Suite</Author>
+    <Version>1.0</Version>
+    <Description>Pre-generated grass cache files for {display_name} season. Provides optimal grass performance in Skyrim SE/AE/VR.</Description>
+    <Website>https://github.com/ReidenXerx/ngio-automation-suite</Website>
+</fomod>"""
+
+_LOD_README_TEMPLATE = """Grass Cache - Default (LOD Generation)
+==================================================
+
+Generated by NGIO Automation Suite
+Source Season: {source_season_name}
+Creation Date: {timestamp}
+
+⚠️  IMPORTANT: This mod is ONLY for DynDOLOD LOD generation!
+
+DESCRIPTION:
+This mod contains grass cache files WITHOUT seasonal postfixes.
+These files are required when generating grass LOD with DynDOLOD.
+
+CONTENTS:
+- {file_count} grass cache files (.cgid - no seasonal suffix)
+
+WHEN TO USE THIS MOD:
+✅ Enable ONLY when running DynDOLOD for grass LOD generation
+❌ Keep DISABLED during normal gameplay
+
+HOW TO USE:
+1. Install this mod in your mod manager
+2. Keep it DISABLED by default
+3. When you want to generate grass LOD with DynDOLOD:
+   a. Enable this mod (Grass Cache - Default)
+   b. Disable your seasonal grass cache mods temporarily
+   c. Run DynDOLOD with grass LOD options
+   d. After DynDOLOD completes, DISABLE this mod again
+   e. Re-enable your seasonal grass cache mods
+4. Your grass LOD is now generated!
+
+WHY IS THIS NEEDED:
+DynDOLOD requires grass cache files without seasonal extensions
+to properly generate grass LOD. Seasonal files (.WIN.cgid, .SPR.cgid,
+etc.) are not recognized by DynDOLOD's grass LOD system.
+
+INSTALLATION:
+- Mod Organizer 2: Install as a mod, keep disabled by default
+- Vortex: Install as a mod, set to disabled
+
+SOURCE INFORMATION:
+This LOD grass cache was generated from: {source_season_name} season
+The grass density and settings match your {source_season_name} grass cache.
+
+CREDITS:
+- NGIO Development Team: Original grass cache system
+- DynDOLOD: LOD generation system
+- NGIO Automation Suite: Automated generation
+
+Generated by NGIO Automation Suite
+https://github.com/ReidenXerx/ngio-automation-suite
+"""
+
+_LOD_META_INI_TEMPLATE = """[General]
+modid=0
+version=1.0
+newestVersion=1.0
+category=23
+installationFile=Generated by NGIO Automation Suite
+
+[installedFiles]
+size=1
+
+[comments]
+Grass Cache - Default (for DynDOLOD LOD generation)
+Generated from: {source_season_name} season
+Generated: {timestamp}
+NOTE: Enable ONLY when generating grass LOD with DynDOLOD!
+"""
+
+_INSTALLATION_GUIDE = """NGIO Grass Cache - Installation Guide
+=====================================
+
+OVERVIEW:
+This package contains pre-generated grass cache files for all seasons.
+These files dramatically improve grass rendering performance in Skyrim.
+
+WHAT'S INCLUDED:
+- Grass_Cache_Winter_Season.zip
+- Grass_Cache_Spring_Season.zip  
+- Grass_Cache_Summer_Season.zip
+- Grass_Cache_Autumn_Season.zip
+
+REQUIREMENTS:
+1. Skyrim SE/AE/VR
+2. SKSE64 (latest version)
+3. Grass Cache Helper NG mod
+4. Seasons of Skyrim (or compatible seasonal mod)
+
+INSTALLATION STEPS:
+
+Step 1: Install Required Mods
+- Download and install Grass Cache Helper NG from Nexus
+- Ensure your seasonal mod (Seasons of Skyrim) is installed
+- Make sure SKSE64 is properly installed
+
+Step 2: Install Grass Cache Archives
+- Install each seasonal archive as a separate mod in your mod manager
+- In Mod Organizer 2: Use "Install from Archive" for each zip file
+- In Vortex: Drag and drop each zip file into the mods area
+
+Step 3: Configure Load Order
+- Enable all four seasonal grass cache mods
+- Ensure Grass Cache Helper NG is loaded after SKSE plugins
+- DISABLE the original NGIO mod (very important!)
+
+Step 4: Configure Seasonal Settings
+- Set your seasonal mod to the desired season
+- The grass cache will automatically match the active season
+
+Step 5: Test In-Game
+- Launch Skyrim through SKSE
+- Load a save in an outdoor area
+- Grass should render with improved performance
+
+TROUBLESHOOTING:
+
+No Grass Visible:
+- Check that Grass Cache Helper NG is active
+- Verify NGIO is disabled
+- Ensure seasonal grass cache mod is enabled
+
+Poor Performance:
+- Make sure NGIO is completely disabled
+- Check for conflicts with other grass mods
+- Verify SKSE is running properly
+
+Crashes:
+- Check for mod conflicts
+- Ensure all requirements are met
+- Try disabling other grass-related mods
+
+Wrong Season:
+- Check your seasonal mod settings
+- Verify the correct seasonal cache is enabled
+- Restart the game after changing seasons
+
+ADVANCED CONFIGURATION:
+
+Multiple Profiles:
+- You can create separate MO2 profiles for each season
+- Enable only the appropriate seasonal cache in each profile
+- Switch profiles when changing seasons
+
+Performance Tuning:
+- Grass cache works with all grass density settings
+- Compatible with ENB grass modifications
+- Works with landscape texture overhauls
+
+UNINSTALLATION:
+1. Disable all seasonal grass cache mods
+2. Re-enable NGIO if desired
+3. Remove the grass cache mod files
+
+SUPPORT:
+For issues or questions:
+- Check the troubleshooting section above
+- Visit the NGIO Automation Suite GitHub page
+- Post in the Nexus comments for Grass Cache Helper NG
+
+CREDITS:
+- NGIO Development Team: Original grass cache system
+- Grass Cache Helper NG: Seasonal cache loading
+- NGIO Automation Suite: Automated generation
+
+Generated by NGIO Automation Suite
+https://github.com/ReidenXerx/ngio-automation-suite
+"""
+
 
 @dataclass
 class ArchiveInfo:
@@ -40,9 +353,21 @@ class ArchiveCreator:
     - Provides user-friendly naming
     """
     
-    def __init__(self, output_directory: str = None):
+    def __init__(self, output_directory: str = None, compress_level: int = 3, use_zstd: bool = False):
         self.logger = Logger("ArchiveCreator")
         
+        # DEFLATE level for archive members; 3 is within a couple percent of 6's
+        # ratio at about twice the speed
+        self.compress_level = compress_level
+        
+        # Opt-in Zstandard members - only for mod managers that can read them
+        self.compression = zipfile.ZIP_DEFLATED
+        if use_zstd:
+            if ZIP_ZSTD is None:
+                self.logger.warning("⚠️ Zstandard archives require Python 3.14+, falling back to DEFLATE")
+            else:
+                self.compression = ZIP_ZSTD
+        
         # Set output directory for archives
         if output_directory:
             self.output_directory = output_directory
@@ -57,9 +382,12 @@ class ArchiveCreator:
         
         # Archive creation statistics
         self.created_archives: List[ArchiveInfo] = []
+        self._archives_lock = threading.Lock()
     
     def create_season_archive(self, season, grass_files_directory: str, 
-                            custom_name: Optional[str] = None) -> Optional[ArchiveInfo]:
+                            custom_name: Optional[str] = None,
+                            seasonal_files: Optional[List[str]] = None,
+                            progress_callback: Optional[Callable] = None) -> Optional[ArchiveInfo]:
         """
         Create a mod archive for a specific season
         
@@ -67,6 +395,8 @@ class ArchiveCreator:
             season: Season enum with name and extension info
             grass_files_directory: Directory containing the seasonal .cgid files
             custom_name: Optional custom name for the archive
+            seasonal_files: Already-enumerated seasonal files (skips the directory scan)
+            progress_callback: Optional callback(done, total) as grass files are archived
             
         Returns:
             ArchiveInfo if successful, None if failed
@@ -82,7 +412,8 @@ class ArchiveCreator:
         archive_path = os.path.join(self.output_directory, archive_name)
         
         # Find seasonal grass files
-        seasonal_files = self._find_seasonal_files(grass_files_directory, season.extension)
+        if seasonal_files is None:
+            seasonal_files = self._find_seasonal_files(grass_files_directory, season.extension)
         
         if not seasonal_files:
             self.logger.error(f"❌ No seasonal files found for {season.display_name} ({season.extension})")
@@ -91,286 +422,195 @@ class ArchiveCreator:
         self.logger.info(f"📁 Found {len(seasonal_files)} files for {season.display_name}")
         
         try:
-            # Create temporary directory for archive structure
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Create mod structure
-                mod_structure = self._create_mod_structure(temp_dir, season, seasonal_files)
-                
-                if not mod_structure:
-                    return None
-                
-                # Create the zip archive
-                archive_info = self._create_zip_archive(mod_structure, archive_path, season)
-                
-                if archive_info:
+            # Plan the mod layout straight from the source files (no staging copy)
+            entries = self._plan_mod_entries(seasonal_files)
+            metadata = self._generate_mod_metadata(season, len(entries))
+            
+            # Create the zip archive
+            archive_info = self._create_zip_archive(entries, metadata, archive_path, season,
+                                                    progress_callback)
+            
+            if archive_info:
+                with self._archives_lock:
                     self.created_archives.append(archive_info)
-                    self.logger.success(f"✅ Created archive: {archive_name}")
-                    self.logger.info(f"📊 Archive size: {archive_info.archive_size_mb:.1f} MB")
-                    self.logger.info(f"📁 Files included: {archive_info.file_count}")
-                
-                return archive_info
-                
+                self.logger.success(f"✅ Created archive: {archive_name}")
+                self.logger.info(f"📊 Archive size: {archive_info.archive_size_mb:.1f} MB")
+                self.logger.info(f"📁 Files included: {archive_info.file_count}")
+            
+            return archive_info
+            
         except Exception as e:
             self.logger.error(f"💥 Failed to create archive for {season.display_name}: {e}")
             return None
     
-    def _find_seasonal_files(self, directory: str, extension: str) -> List[str]:
-        """Find all files with the seasonal extension"""
-        seasonal_files = []
+    def _iter_files(self, directory: str, skip_dirs: frozenset = frozenset()):
+        """
+        Yield a DirEntry for every file under directory (recursive)
+        
+        Explicit os.scandir stack instead of os.walk: type checks come from the
+        cached DirEntry data and entry.path is already joined. Hidden
+        subdirectories and any named in skip_dirs are not descended into.
+        """
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (entry.name.startswith('.') or entry.name in skip_dirs):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError as e:
+                self.logger.error(f"Error scanning directory {current}: {e}")
+    
+    def _enumerate_by_extension(self, directory: str, extensions) -> Dict[str, List[str]]:
+        """Find the files for several seasonal extensions in a single directory walk"""
+        buckets = {extension: [] for extension in extensions}
         
         if not os.path.exists(directory):
             self.logger.error(f"❌ Directory not found: {directory}")
-            return seasonal_files
+            return buckets
         
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith(extension):
-                        full_path = os.path.join(root, file)
-                        seasonal_files.append(full_path)
-        except Exception as e:
-            self.logger.error(f"Error scanning directory {directory}: {e}")
+        # Match by dict lookup on the name's last one/two/... dotted suffixes
+        # rather than an endswith() per extension (".cgid" and ".WIN.cgid" both hit)
+        max_dots = max((extension.count('.') for extension in buckets), default=0)
+        get_bucket = buckets.get
+        
+        # In a per-season folder layout (WIN/, SPR/, ...) skip unrequested seasons' folders
+        for entry in self._iter_files(directory, _season_skip_dirs(extensions)):
+            name = entry.name
+            dot = len(name)
+            for _ in range(max_dots):
+                dot = name.rfind('.', 0, dot)
+                if dot < 0:
+                    break
+                bucket = get_bucket(name[dot:])
+                if bucket is not None:
+                    bucket.append(entry.path)
         
-        return seasonal_files
+        return buckets
+    
+    def _find_seasonal_files(self, directory: str, extension: str) -> List[str]:
+        """Find all files with the seasonal extension"""
+        return self._enumerate_by_extension(directory, [extension])[extension]
     
-    def _create_mod_structure(self, temp_dir: str, season, seasonal_files: List[str]) -> Optional[str]:
+    def _plan_mod_entries(self, source_files: List[str]) -> List[Tuple[str, str]]:
         """
-        Create the proper mod directory structure
+        Map grass files to their place in the mod archive
         
         Args:
-            temp_dir: Temporary directory for building the structure
-            season: Season enum
-            seasonal_files: List of seasonal grass cache files
+            source_files: Grass cache files to include
             
         Returns:
-            str: Path to the mod root directory, or None if failed
+            List of (source_path, arcname) pairs under Data/Grass/
         """
-        try:
-            # Create mod root directory
-            mod_root = os.path.join(temp_dir, f"Grass_Cache_{season.display_name}")
-            data_dir = os.path.join(mod_root, "Data")
-            grass_dir = os.path.join(data_dir, "Grass")
-            
-            os.makedirs(grass_dir, exist_ok=True)
-            
-            # Copy seasonal files to Grass directory
-            copied_files = 0
-            for source_file in seasonal_files:
-                filename = os.path.basename(source_file)
-                target_file = os.path.join(grass_dir, filename)
-                
-                try:
-                    shutil.copy2(source_file, target_file)
-                    copied_files += 1
-                except Exception as e:
-                    self.logger.warning(f"Failed to copy {filename}: {e}")
-            
-            if copied_files == 0:
-                self.logger.error("❌ No files were copied to mod structure")
-                return None
-            
-            # Create mod metadata files
-            self._create_mod_metadata_files(mod_root, season, copied_files)
-            
-            self.logger.info(f"📁 Created mod structure with {copied_files} files")
-            return mod_root
-            
-        except Exception as e:
-            self.logger.error(f"💥 Error creating mod structure: {e}")
-            return None
-    
-    def _create_mod_metadata_files(self, mod_root: str, season, file_count: int) -> None:
-        """Create metadata files for the mod"""
-        try:
-            # Create README.txt
-            readme_path = os.path.join(mod_root, "README.txt")
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(self._generate_readme_content(season, file_count))
-            
-            # Create meta.ini for Mod Organizer 2
-            meta_path = os.path.join(mod_root, "meta.ini")
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                f.write(self._generate_meta_ini_content(season))
-            
-            # Create fomod installer info (optional)
-            self._create_fomod_installer(mod_root, season)
-            
-            self.logger.debug(f"📝 Created metadata files for {season.display_name}")
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to create metadata files: {e}")
-    
-    def _generate_readme_content(self, season, file_count: int) -> str:
-        """Generate README.txt content"""
-        return f"""Grass Cache - {season.display_name} Season
-{'=' * 50}
-
-Generated by NGIO Automation Suite
-Creation Date: {time.strftime('%Y-%m-%d %H:%M:%S')}
-
-DESCRIPTION:
-This mod contains pre-generated grass cache files for the {season.display_name} season.
-These files enable high-performance grass rendering in Skyrim SE/AE/VR.
-
-CONTENTS:
-- {file_count} grass cache files ({season.extension})
-- Season Type: {season.season_type}
-
-REQUIREMENTS:
-- Skyrim SE/AE/VR
-- SKSE64
-- Grass Cache Helper NG (for seasonal switching)
-- Seasons of Skyrim (or compatible seasonal mod)
-
-INSTALLATION:
-1. Install this mod using your preferred mod manager (MO2, Vortex, etc.)
-2. Ensure Grass Cache Helper NG is installed and enabled
-3. Make sure NGIO is DISABLED (important!)
-4. Set your seasonal mod to use {season.display_name} season
-5. Launch Skyrim and enjoy improved grass performance!
-
-COMPATIBILITY:
-- Compatible with all grass mods
-- Compatible with ENB and weather mods
-- Works with landscape overhauls
-- May conflict with other grass cache mods (disable them)
-
-UNINSTALLATION:
-Simply disable or remove this mod through your mod manager.
-
-TROUBLESHOOTING:
-- If grass doesn't appear: Check that Grass Cache Helper NG is active
-- If performance is poor: Ensure NGIO is disabled
-- If crashes occur: Check for mod conflicts
-
-CREDITS:
-- NGIO Development Team: For the grass cache system
-- Grass Cache Helper NG: For seasonal cache loading
-- NGIO Automation Suite: For automated generation
-
-For support and updates, visit:
-https://github.com/ReidenXerx/ngio-automation-suite
-
-VERSION: 1.0
-LICENSE: Mod content follows original mod licenses
-"""
-    
-    def _generate_meta_ini_content(self, season) -> str:
-        """Generate meta.ini content for MO2"""
-        return f"""[General]
-modid=0
-version=1.0
-newestVersion=1.0
-category=23
-installationFile=Generated by NGIO Automation Suite
-
-[installedFiles]
-size=1
-
-[comments]
-Grass Cache for {season.display_name} Season
-Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
-Season Type: {season.season_type}
-Extension: {season.extension}
-"""
-    
-    def _create_fomod_installer(self, mod_root: str, season) -> None:
-        """Create FOMOD installer configuration (optional)"""
-        try:
-            fomod_dir = os.path.join(mod_root, "fomod")
-            os.makedirs(fomod_dir, exist_ok=True)
-            
-            # Create ModuleConfig.xml
-            config_path = os.path.join(fomod_dir, "ModuleConfig.xml")
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(self._generate_fomod_config(season))
-            
-            # Create info.xml
-            info_path = os.path.join(fomod_dir, "info.xml")
-            with open(info_path, 'w', encoding='utf-8') as f:
-                f.write(self._generate_fomod_info(season))
-            
-            self.logger.debug(f"📝 Created FOMOD installer for {season.display_name}")
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to create FOMOD installer: {e}")
+        # Keyed by arcname: a later file with the same name wins, like the old copy did
+        entries = {f"Data/Grass/{os.path.basename(path)}": path for path in source_files}
+        return [(path, arcname) for arcname, path in entries.items()]
+    
+    def _generate_mod_metadata(self, season, file_count: int) -> List[Tuple[str, str]]:
+        """Generate (arcname, content) pairs for the mod metadata files"""
+        # One timestamp for the whole archive
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        return [
+            ("README.txt", self._generate_readme_content(season, file_count, timestamp)),
+            ("meta.ini", self._generate_meta_ini_content(season, timestamp)),      # Mod Organizer 2
+            ("fomod/ModuleConfig.xml", self._generate_fomod_config(season)),
+            ("fomod/info.xml", self._generate_fomod_info(season)),
+        ]
+    
+    def _generate_readme_content(self, season, file_count: int, timestamp: str) -> str:
+        """Generate README.txt content"""
+        return _README_TEMPLATE.format(
+            display_name=season.display_name,
+            extension=season.extension,
+            season_type=season.season_type,
+            file_count=file_count,
+            timestamp=timestamp,
+        )
+    
+    def _generate_meta_ini_content(self, season, timestamp: str) -> str:
+        """Generate meta.ini content for MO2"""
+        return _META_INI_TEMPLATE.format(
+            display_name=season.display_name,
+            extension=season.extension,
+            season_type=season.season_type,
+            timestamp=timestamp,
+        )
     
     def _generate_fomod_config(self, season) -> str:
         """Generate FOMOD ModuleConfig.xml"""
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<config xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="http://qconsulting.ca/fo3/ModConfig5.0.xsd">
-    <moduleName>Grass Cache - {season.display_name} Season</moduleName>
-    <installSteps>
-        <installStep name="Installation">
-            <optionalFileGroups>
-                <group name="Grass Cache Files" type="SelectExactlyOne">
-                    <plugins>
-                        <plugin name="Install {season.display_name} Grass Cache">
-                            <description>Installs pre-generated grass cache for {season.display_name} season.</description>
-                            <files>
-                                <folder source="Data" destination="Data" priority="0" />
-                            </files>
-                            <typeDescriptor>
-                                <type name="Recommended"/>
-                            </typeDescriptor>
-                        </plugin>
-                    </plugins>
-                </group>
-            </optionalFileGroups>
-        </installStep>
-    </installSteps>
-</config>"""
+        return _FOMOD_CONFIG_TEMPLATE.format(display_name=season.display_name)
     
     def _generate_fomod_info(self, season) -> str:
         """Generate FOMOD info.xml"""
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<fomod>
-    <Name>Grass Cache - {season.display_name} Season</Name>
-    <Author>NGIO Automation Suite</Author>
-    <Version>1.0</Version>
-    <Description>Pre-generated grass cache files for {season.display_name} season. Provides optimal grass performance in Skyrim SE/AE/VR.</Description>
-    <Website>https://github.com/ReidenXerx/ngio-automation-suite</Website>
-</fomod>"""
+        return _FOMOD_INFO_TEMPLATE.format(display_name=season.display_name)
+    
+    def _write_mod_zip(self, archive_path: str, entries: List[Tuple[str, str]],
+                       metadata: List[Tuple[str, str]],
+                       progress_callback: Optional[Callable] = None) -> Dict[str, int]:
+        """
+        Write grass files and in-memory metadata into a new zip archive
+        
+        progress_callback(done, total) is called about every 1% of the grass files.
+        
+        Returns:
+            Dict[str, int]: CRC32 of every entry written, by arcname
+        """
+        # Remove existing archive if it exists
+        if os.path.exists(archive_path):
+            os.remove(archive_path)
+        
+        total = len(entries)
+        report_every = max(1, total // 100)
+        
+        with zipfile.ZipFile(archive_path, 'w', self.compression, compresslevel=self.compress_level,
+                             strict_timestamps=False) as zipf:
+            # Grass files are read straight from their source location
+            for done, (source_path, arcname) in enumerate(entries, 1):
+                try:
+                    _write_member(zipf, source_path, arcname)
+                except OSError as e:
+                    self.logger.warning(f"Failed to add {os.path.basename(source_path)}: {e}")
+                
+                if progress_callback and (done % report_every == 0 or done == total):
+                    progress_callback(done, total)
+            
+            # Metadata files never touch the disk (native newlines, as a text-mode write gave)
+            for arcname, content in metadata:
+                zipf.writestr(arcname, content.replace('\n', os.linesep))
+            
+            return {info.filename: info.CRC for info in zipf.infolist()}
     
-    def _create_zip_archive(self, mod_directory: str, archive_path: str, season) -> Optional[ArchiveInfo]:
+    def _create_zip_archive(self, entries: List[Tuple[str, str]], metadata: List[Tuple[str, str]],
+                            archive_path: str, season,
+                            progress_callback: Optional[Callable] = None) -> Optional[ArchiveInfo]:
         """
         Create the final zip archive
         
         Args:
-            mod_directory: Directory containing the mod structure
+            entries: (source_path, arcname) pairs for the grass files
+            metadata: (arcname, content) pairs for generated metadata files
             archive_path: Path for the output archive
             season: Season enum
+            progress_callback: Optional callback(done, total) for progress updates
             
         Returns:
             ArchiveInfo if successful, None if failed
         """
         try:
             start_time = time.time()
-            file_count = 0
-            
-            # Remove existing archive if it exists
-            if os.path.exists(archive_path):
-                os.remove(archive_path)
-            
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
-                # Walk through mod directory and add all files
-                for root, dirs, files in os.walk(mod_directory):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        
-                        # Calculate relative path within the archive
-                        arcname = os.path.relpath(file_path, mod_directory)
-                        
-                        # Add file to archive
-                        zipf.write(file_path, arcname)
-                        file_count += 1
+            written_crcs = self._write_mod_zip(archive_path, entries, metadata, progress_callback)
+            file_count = len(written_crcs)
             
             # Get archive size
             archive_size_mb = os.path.getsize(archive_path) / (1024 * 1024)
             creation_time = time.time() - start_time
             
             # Validate archive
-            if not self._validate_archive(archive_path):
+            if not self._validate_archive(archive_path, written_crcs):
                 self.logger.error(f"❌ Archive validation failed: {archive_path}")
                 return None
             
@@ -393,15 +633,31 @@ Extension: {season.extension}
             self.logger.error(f"💥 Error creating zip archive: {e}")
             return None
     
-    def _validate_archive(self, archive_path: str) -> bool:
-        """Validate that the archive was created correctly"""
+    def _validate_archive(self, archive_path: str, expected_crcs: Optional[Dict[str, int]] = None,
+                          full_check: bool = False) -> bool:
+        """
+        Validate that the archive was created correctly
+        
+        Args:
+            archive_path: Path to archive
+            expected_crcs: CRC32 per arcname recorded while writing the archive
+            full_check: Decompress every entry (testzip) even when CRCs are known
+        """
         try:
             with zipfile.ZipFile(archive_path, 'r') as zipf:
-                # Test the archive
-                bad_file = zipf.testzip()
-                if bad_file:
-                    self.logger.error(f"❌ Corrupted file in archive: {bad_file}")
-                    return False
+                if full_check or expected_crcs is None:
+                    # Test the archive
+                    bad_file = zipf.testzip()
+                    if bad_file:
+                        self.logger.error(f"❌ Corrupted file in archive: {bad_file}")
+                        return False
+                else:
+                    # The central directory read back must match what we just wrote;
+                    # skips a full decompress of data we computed the CRCs of ourselves
+                    actual_crcs = {info.filename: info.CRC for info in zipf.infolist()}
+                    if actual_crcs != expected_crcs:
+                        self.logger.error("❌ Archive contents don't match what was written")
+                        return False
                 
                 # Check that it contains expected structure
                 file_list = zipf.namelist()
@@ -544,25 +800,22 @@ Extension: {season.extension}
         self.logger.info(f"📁 Found {len(lod_files)} LOD grass files")
         
         try:
-            # Create temporary directory for archive structure
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Create mod structure for LOD grass
-                mod_structure = self._create_lod_mod_structure(temp_dir, lod_files, source_season_name)
-                
-                if not mod_structure:
-                    return None
-                
-                # Create the zip archive
-                archive_info = self._create_lod_zip_archive(mod_structure, archive_path, source_season_name, len(lod_files))
-                
-                if archive_info:
+            # Plan the mod layout straight from the source files (no staging copy)
+            entries = self._plan_mod_entries(lod_files)
+            metadata = self._generate_lod_metadata(source_season_name, len(entries))
+            
+            # Create the zip archive
+            archive_info = self._create_lod_zip_archive(entries, metadata, archive_path, source_season_name)
+            
+            if archive_info:
+                with self._archives_lock:
                     self.created_archives.append(archive_info)
-                    self.logger.success(f"✅ Created LOD archive: {archive_name}")
-                    self.logger.info(f"📊 Archive size: {archive_info.archive_size_mb:.1f} MB")
-                    self.logger.info(f"📁 Files included: {archive_info.file_count}")
-                
-                return archive_info
-                
+                self.logger.success(f"✅ Created LOD archive: {archive_name}")
+                self.logger.info(f"📊 Archive size: {archive_info.archive_size_mb:.1f} MB")
+                self.logger.info(f"📁 Files included: {archive_info.file_count}")
+            
+            return archive_info
+            
         except Exception as e:
             self.logger.error(f"💥 Failed to create LOD grass archive: {e}")
             return None
@@ -570,206 +823,70 @@ Extension: {season.extension}
     def _find_lod_grass_files(self, directory: str) -> List[str]:
         """Find all plain .cgid files (without seasonal suffixes)"""
         lod_files = []
-        seasonal_suffixes = ['.WIN.cgid', '.SPR.cgid', '.SUM.cgid', '.AUT.cgid']
+        seasonal_suffixes = tuple(f".{tag}.cgid" for tag in _SEASON_TAGS)
         
         if not os.path.exists(directory):
             self.logger.error(f"❌ Directory not found: {directory}")
             return lod_files
         
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    # Only include .cgid files that DON'T have seasonal suffixes
-                    if file.endswith('.cgid'):
-                        is_seasonal = any(file.endswith(suffix) for suffix in seasonal_suffixes)
-                        if not is_seasonal:
-                            full_path = os.path.join(root, file)
-                            lod_files.append(full_path)
-        except Exception as e:
-            self.logger.error(f"Error scanning directory {directory}: {e}")
+        for entry in self._iter_files(directory):
+            # Only include .cgid files that DON'T have seasonal suffixes
+            if entry.name.endswith('.cgid'):
+                is_seasonal = entry.name.endswith(seasonal_suffixes)
+                if not is_seasonal:
+                    lod_files.append(entry.path)
         
         return lod_files
     
-    def _create_lod_mod_structure(self, temp_dir: str, lod_files: List[str], 
-                                   source_season_name: str) -> Optional[str]:
-        """
-        Create the proper mod directory structure for LOD grass
-        
-        Args:
-            temp_dir: Temporary directory for building the structure
-            lod_files: List of LOD grass cache files
-            source_season_name: Season used as source
-            
-        Returns:
-            str: Path to the mod root directory, or None if failed
-        """
-        try:
-            # Create mod root directory
-            mod_root = os.path.join(temp_dir, "Grass_Cache_Default")
-            data_dir = os.path.join(mod_root, "Data")
-            grass_dir = os.path.join(data_dir, "Grass")
-            
-            os.makedirs(grass_dir, exist_ok=True)
-            
-            # Copy LOD files to Grass directory
-            copied_files = 0
-            for source_file in lod_files:
-                filename = os.path.basename(source_file)
-                target_file = os.path.join(grass_dir, filename)
-                
-                try:
-                    shutil.copy2(source_file, target_file)
-                    copied_files += 1
-                except Exception as e:
-                    self.logger.warning(f"Failed to copy {filename}: {e}")
-            
-            if copied_files == 0:
-                self.logger.error("❌ No files were copied to mod structure")
-                return None
-            
-            # Create LOD-specific metadata files
-            self._create_lod_metadata_files(mod_root, source_season_name, copied_files)
-            
-            self.logger.info(f"📁 Created LOD mod structure with {copied_files} files")
-            return mod_root
-            
-        except Exception as e:
-            self.logger.error(f"💥 Error creating LOD mod structure: {e}")
-            return None
-    
-    def _create_lod_metadata_files(self, mod_root: str, source_season_name: str, file_count: int) -> None:
-        """Create metadata files for the LOD grass mod"""
-        try:
-            # Create README.txt with LOD-specific instructions
-            readme_path = os.path.join(mod_root, "README.txt")
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(self._generate_lod_readme_content(source_season_name, file_count))
-            
-            # Create meta.ini for Mod Organizer 2
-            meta_path = os.path.join(mod_root, "meta.ini")
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                f.write(self._generate_lod_meta_ini_content(source_season_name))
-            
-            self.logger.debug(f"📝 Created LOD metadata files")
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to create LOD metadata files: {e}")
+    def _generate_lod_metadata(self, source_season_name: str, file_count: int) -> List[Tuple[str, str]]:
+        """Generate (arcname, content) pairs for the LOD grass mod metadata files"""
+        # One timestamp for the whole archive
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        return [
+            ("README.txt", self._generate_lod_readme_content(source_season_name, file_count, timestamp)),
+            ("meta.ini", self._generate_lod_meta_ini_content(source_season_name, timestamp)),  # Mod Organizer 2
+        ]
     
-    def _generate_lod_readme_content(self, source_season_name: str, file_count: int) -> str:
+    def _generate_lod_readme_content(self, source_season_name: str, file_count: int, timestamp: str) -> str:
         """Generate README.txt content for LOD grass mod"""
-        return f"""Grass Cache - Default (LOD Generation)
-{'=' * 50}
-
-Generated by NGIO Automation Suite
-Source Season: {source_season_name}
-Creation Date: {time.strftime('%Y-%m-%d %H:%M:%S')}
-
-⚠️  IMPORTANT: This mod is ONLY for DynDOLOD LOD generation!
-
-DESCRIPTION:
-This mod contains grass cache files WITHOUT seasonal postfixes.
-These files are required when generating grass LOD with DynDOLOD.
-
-CONTENTS:
-- {file_count} grass cache files (.cgid - no seasonal suffix)
-
-WHEN TO USE THIS MOD:
-✅ Enable ONLY when running DynDOLOD for grass LOD generation
-❌ Keep DISABLED during normal gameplay
-
-HOW TO USE:
-1. Install this mod in your mod manager
-2. Keep it DISABLED by default
-3. When you want to generate grass LOD with DynDOLOD:
-   a. Enable this mod (Grass Cache - Default)
-   b. Disable your seasonal grass cache mods temporarily
-   c. Run DynDOLOD with grass LOD options
-   d. After DynDOLOD completes, DISABLE this mod again
-   e. Re-enable your seasonal grass cache mods
-4. Your grass LOD is now generated!
-
-WHY IS THIS NEEDED:
-DynDOLOD requires grass cache files without seasonal extensions
-to properly generate grass LOD. Seasonal files (.WIN.cgid, .SPR.cgid,
-etc.) are not recognized by DynDOLOD's grass LOD system.
-
-INSTALLATION:
-- Mod Organizer 2: Install as a mod, keep disabled by default
-- Vortex: Install as a mod, set to disabled
-
-SOURCE INFORMATION:
-This LOD grass cache was generated from: {source_season_name} season
-The grass density and settings match your {source_season_name} grass cache.
-
-CREDITS:
-- NGIO Development Team: Original grass cache system
-- DynDOLOD: LOD generation system
-- NGIO Automation Suite: Automated generation
-
-Generated by NGIO Automation Suite
-https://github.com/ReidenXerx/ngio-automation-suite
-"""
+        return _LOD_README_TEMPLATE.format(
+            source_season_name=source_season_name,
+            file_count=file_count,
+            timestamp=timestamp,
+        )
     
-    def _generate_lod_meta_ini_content(self, source_season_name: str) -> str:
+    def _generate_lod_meta_ini_content(self, source_season_name: str, timestamp: str) -> str:
         """Generate meta.ini content for LOD grass MO2"""
-        return f"""[General]
-modid=0
-version=1.0
-newestVersion=1.0
-category=23
-installationFile=Generated by NGIO Automation Suite
-
-[installedFiles]
-size=1
-
-[comments]
-Grass Cache - Default (for DynDOLOD LOD generation)
-Generated from: {source_season_name} season
-Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
-NOTE: Enable ONLY when generating grass LOD with DynDOLOD!
-"""
+        return _LOD_META_INI_TEMPLATE.format(
+            source_season_name=source_season_name,
+            timestamp=timestamp,
+        )
     
-    def _create_lod_zip_archive(self, mod_directory: str, archive_path: str, 
-                                 source_season_name: str, file_count: int) -> Optional[ArchiveInfo]:
+    def _create_lod_zip_archive(self, entries: List[Tuple[str, str]], metadata: List[Tuple[str, str]],
+                                 archive_path: str, source_season_name: str) -> Optional[ArchiveInfo]:
         """
         Create the final LOD zip archive
         
         Args:
-            mod_directory: Directory containing the mod structure
+            entries: (source_path, arcname) pairs for the LOD grass files
+            metadata: (arcname, content) pairs for generated metadata files
             archive_path: Path for the output archive
             source_season_name: Season used as source
-            file_count: Number of grass files
             
         Returns:
             ArchiveInfo if successful, None if failed
         """
         try:
             start_time = time.time()
-            actual_file_count = 0
-            
-            # Remove existing archive if it exists
-            if os.path.exists(archive_path):
-                os.remove(archive_path)
-            
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
-                # Walk through mod directory and add all files
-                for root, dirs, files in os.walk(mod_directory):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        
-                        # Calculate relative path within the archive
-                        arcname = os.path.relpath(file_path, mod_directory)
-                        
-                        # Add file to archive
-                        zipf.write(file_path, arcname)
-                        actual_file_count += 1
+            written_crcs = self._write_mod_zip(archive_path, entries, metadata)
+            actual_file_count = len(written_crcs)
             
             # Get archive size
             archive_size_mb = os.path.getsize(archive_path) / (1024 * 1024)
             creation_time = time.time() - start_time
             
             # Validate archive
-            if not self._validate_archive(archive_path):
+            if not self._validate_archive(archive_path, written_crcs):
                 self.logger.error(f"❌ LOD archive validation failed: {archive_path}")
                 return None
             
@@ -804,12 +921,37 @@ NOTE: Enable ONLY when generating grass LOD with DynDOLOD!
         """
         self.logger.info(f"📦 Creating archives for {len(seasons)} seasons...")
         
+        results = {}
+        
+        # One walk of the grass directory serves every season
+        files_by_extension = self._enumerate_by_extension(
+            grass_directory, {season.extension for season in seasons}
+        )
+        
+        if len(seasons) <= 1:
+            for season in seasons:
+                self.logger.separator(f"Creating {season.display_name} Archive")
+                results[season] = self.create_season_archive(
+                    season, grass_directory, seasonal_files=files_by_extension[season.extension]
+                )
+        else:
+            # Seasons are independent (own files, own zip); zlib releases the GIL
+            # while deflating, so threads build them in parallel
+            max_workers = min(len(seasons), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_season = {
+                    executor.submit(self.create_season_archive, season, grass_directory,
+                                    seasonal_files=files_by_extension[season.extension]): season
+                    for season in seasons
+                }
+                
+                for future in as_completed(future_to_season):
+                    results[future_to_season[future]] = future.result()
+        
         created_archives = []
         
         for season in seasons:
-            self.logger.separator(f"Creating {season.display_name} Archive")
-            
-            archive_info = self.create_season_archive(season, grass_directory)
+            archive_info = results[season]
             
             if archive_info:
                 created_archives.append(archive_info)
@@ -825,15 +967,18 @@ NOTE: Enable ONLY when generating grass LOD with DynDOLOD!
         self.logger.info(f"📁 Total archive size: {total_size:.1f} MB")
         
         if created_archives:
-            self.logger.info("📦 Created archives:")
-            for archive in created_archives:
-                self.logger.info(f"   ✅ {archive.season_name}: {os.path.basename(archive.archive_path)} ({archive.archive_size_mb:.1f} MB)")
+            summary = "\n".join(
+                f"   ✅ {archive.season_name}: {os.path.basename(archive.archive_path)} ({archive.archive_size_mb:.1f} MB)"
+                for archive in created_archives
+            )
+            self.logger.info("📦 Created archives:\n" + summary)
         
         return created_archives
     
-    def get_created_archives(self) -> List[ArchiveInfo]:
-        """Get list of all created archives"""
-        return self.created_archives.copy()
+    def get_created_archives(self) -> Tuple[ArchiveInfo, ...]:
+        """Get all created archives (read-only snapshot)"""
+        with self._archives_lock:
+            return tuple(self.created_archives)
     
     def cleanup_output_directory(self, keep_latest: int = 5) -> None:
         """
@@ -846,12 +991,13 @@ NOTE: Enable ONLY when generating grass LOD with DynDOLOD!
             if not os.path.exists(self.output_directory):
                 return
             
-            # Get all archive files
-            archive_files = []
-            for file in os.listdir(self.output_directory):
-                if file.endswith('.zip') and 'Grass_Cache_' in file:
-                    file_path = os.path.join(self.output_directory, file)
-                    archive_files.append((file_path, os.path.getctime(file_path)))
+            # Get all archive files (one scandir pass, ctime from the DirEntry)
+            with os.scandir(self.output_directory) as it:
+                archive_files = [
+                    (entry.path, entry.stat().st_ctime)
+                    for entry in it
+                    if entry.name.endswith('.zip') and 'Grass_Cache_' in entry.name
+                ]
             
             # Sort by creation time (newest first)
             archive_files.sort(key=lambda x: x[1], reverse=True)
@@ -898,104 +1044,7 @@ NOTE: Enable ONLY when generating grass LOD with DynDOLOD!
     
     def _generate_installation_guide_content(self) -> str:
         """Generate comprehensive installation guide content"""
-        return """NGIO Grass Cache - Installation Guide
-=====================================
-
-OVERVIEW:
-This package contains pre-generated grass cache files for all seasons.
-These files dramatically improve grass rendering performance in Skyrim.
-
-WHAT'S INCLUDED:
-- Grass_Cache_Winter_Season.zip
-- Grass_Cache_Spring_Season.zip  
-- Grass_Cache_Summer_Season.zip
-- Grass_Cache_Autumn_Season.zip
-
-REQUIREMENTS:
-1. Skyrim SE/AE/VR
-2. SKSE64 (latest version)
-3. Grass Cache Helper NG mod
-4. Seasons of Skyrim (or compatible seasonal mod)
-
-INSTALLATION STEPS:
-
-Step 1: Install Required Mods
-- Download and install Grass Cache Helper NG from Nexus
-- Ensure your seasonal mod (Seasons of Skyrim) is installed
-- Make sure SKSE64 is properly installed
-
-Step 2: Install Grass Cache Archives
-- Install each seasonal archive as a separate mod in your mod manager
-- In Mod Organizer 2: Use "Install from Archive" for each zip file
-- In Vortex: Drag and drop each zip file into the mods area
-
-Step 3: Configure Load Order
-- Enable all four seasonal grass cache mods
-- Ensure Grass Cache Helper NG is loaded after SKSE plugins
-- DISABLE the original NGIO mod (very important!)
-
-Step 4: Configure Seasonal Settings
-- Set your seasonal mod to the desired season
-- The grass cache will automatically match the active season
-
-Step 5: Test In-Game
-- Launch Skyrim through SKSE
-- Load a save in an outdoor area
-- Grass should render with improved performance
-
-TROUBLESHOOTING:
-
-No Grass Visible:
-- Check that Grass Cache Helper NG is active
-- Verify NGIO is disabled
-- Ensure seasonal grass cache mod is enabled
-
-Poor Performance:
-- Make sure NGIO is completely disabled
-- Check for conflicts with other grass mods
-- Verify SKSE is running properly
-
-Crashes:
-- Check for mod conflicts
-- Ensure all requirements are met
-- Try disabling other grass-related mods
-
-Wrong Season:
-- Check your seasonal mod settings
-- Verify the correct seasonal cache is enabled
-- Restart the game after changing seasons
-
-ADVANCED CONFIGURATION:
-
-Multiple Profiles:
-- You can create separate MO2 profiles for each season
-- Enable only the appropriate seasonal cache in each profile
-- Switch profiles when changing seasons
-
-Performance Tuning:
-- Grass cache works with all grass density settings
-- Compatible with ENB grass modifications
-- Works with landscape texture overhauls
-
-UNINSTALLATION:
-1. Disable all seasonal grass cache mods
-2. Re-enable NGIO if desired
-3. Remove the grass cache mod files
-
-SUPPORT:
-For issues or questions:
-- Check the troubleshooting section above
-- Visit the NGIO Automation Suite GitHub page
-- Post in the Nexus comments for Grass Cache Helper NG
-
-CREDITS:
-- NGIO Development Team: Original grass cache system
-- Grass Cache Helper NG: Seasonal cache loading
-- NGIO Automation Suite: Automated generation
-
-Generated by NGIO Automation Suite
-https://github.com/ReidenXerx/ngio-automation-suite
-"""
+        return _INSTALLATION_GUIDE
 
 
 def main():
@@ -5,13 +5,20 @@ Handles backup, modification, and restoration of game configuration files
 """
 
 import os
+import io
+import codecs
 import shutil
-import configparser
-from typing import Dict, List, Optional, Tuple
+import tarfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
-from datetime import datetime
 
 from ..utils.logger import Logger
+from ..utils import fast_ini
+
+
+# Tried in order when a (non UTF-16) INI file isn't valid UTF-8
+_ENCODING_FALLBACKS = ('cp1252',)
 
 
 class ConfigManager:
@@ -26,14 +33,35 @@ class ConfigManager:
     - Validate configuration integrity
     """
     
+    # Key names Seasons of Skyrim accepts for the season type (lowercased)
+    _SEASON_KEYS = frozenset({'season type', 'seasontype', 'season'})
+    
+    _SKYRIM_REGISTRY_KEY = r"SOFTWARE\WOW6432Node\Bethesda Softworks\Skyrim Special Edition"
+    
+    # Common install locations, probed when the registry lookup fails
+    _SKYRIM_CANDIDATES = tuple(
+        os.path.join(path, "SkyrimSE.exe") for path in (
+            r"C:\Program Files (x86)\Steam\steamapps\common\Skyrim Special Edition",
+            r"C:\Program Files\Steam\steamapps\common\Skyrim Special Edition",
+            r"C:\Games\Steam\steamapps\common\Skyrim Special Edition",
+            r"D:\Steam\steamapps\common\Skyrim Special Edition",
+            r"E:\Steam\steamapps\common\Skyrim Special Edition"
+        )
+    )
+    
     def __init__(self, skyrim_path: Optional[str] = None):
         self.logger = Logger("ConfigManager")
         
         # Configuration file paths
         self.skyrim_path = skyrim_path
         self.config_files = {}
+        self._config_exists: Dict[str, bool] = {}
         self.backup_directory = None
-        self.original_configs = {}
+        self.backup_archive = None
+        self.original_configs: Dict[str, bytes] = {}
+        
+        # Parsed INI contents keyed by path -> (mtime_ns, size, sections)
+        self._parse_cache: Dict[str, Tuple[int, int, Dict[str, Dict[str, str]]]] = {}
         
         # Initialize configuration file locations
         self._initialize_config_paths()
@@ -57,140 +85,298 @@ class ConfigManager:
             "ngio_config": os.path.join(skse_plugins_path, "GrassControl.ini"),
             "dyndolod_config": os.path.join(data_path, "DynDOLOD", "DynDOLOD_SSE.ini")
         }
+        self._config_exists = {name: os.path.isfile(path) for name, path in self.config_files.items()}
         
-        # Create backup directory
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.backup_directory = os.path.join(
-            self.skyrim_path, "NGIO_Backups", f"backup_{timestamp}"
-        )
+        # Backups are stored as one uncompressed tar per run
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        self.backup_directory = os.path.join(self.skyrim_path, "NGIO_Backups")
+        self.backup_archive = os.path.join(self.backup_directory, f"backup_{timestamp}.tar")
         
         self.logger.info(f"📁 Initialized config paths for: {self.skyrim_path}")
-        self.logger.info(f"💾 Backup directory: {self.backup_directory}")
+        self.logger.info(f"💾 Backup archive: {self.backup_archive}")
     
     def _detect_skyrim_path(self) -> Optional[str]:
         """Auto-detect Skyrim installation path"""
-        common_paths = [
-            r"C:\Program Files (x86)\Steam\steamapps\common\Skyrim Special Edition",
-            r"C:\Program Files\Steam\steamapps\common\Skyrim Special Edition",
-            r"C:\Games\Steam\steamapps\common\Skyrim Special Edition",
-            r"D:\Steam\steamapps\common\Skyrim Special Edition",
-            r"E:\Steam\steamapps\common\Skyrim Special Edition"
-        ]
+        # One registry read usually answers before any filesystem probing
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, self._SKYRIM_REGISTRY_KEY) as key:
+                path = winreg.QueryValueEx(key, "installed path")[0].rstrip("\\/")
+            if path and os.path.isfile(os.path.join(path, "SkyrimSE.exe")):
+                self.logger.info(f"🔍 Auto-detected Skyrim from registry: {path}")
+                return path
+        except (ImportError, OSError):
+            pass
         
-        for path in common_paths:
-            if os.path.exists(os.path.join(path, "SkyrimSE.exe")):
+        for exe in self._SKYRIM_CANDIDATES:
+            if os.path.isfile(exe):
+                path = os.path.dirname(exe)
                 self.logger.info(f"🔍 Auto-detected Skyrim at: {path}")
                 return path
                 
         return None
     
-    def _read_config_with_bom_handling(self, config: configparser.ConfigParser, file_path: str) -> None:
+    def _path_if_exists(self, config_name: str) -> Tuple[Optional[str], bool]:
+        """Return a config file's path and whether it existed at startup"""
+        return self.config_files.get(config_name), self._config_exists.get(config_name, False)
+    
+    def _load_ini(self, file_path: str) -> Dict[str, Dict[str, str]]:
         """
-        Read INI file with BOM (Byte Order Mark) handling
-        
-        Some text editors add BOM to UTF-8 files, which breaks ConfigParser.
-        This method strips BOM before parsing.
+        Read an INI file for lookups only, without configparser overhead
         
         Args:
-            config: ConfigParser instance to read into
             file_path: Path to the INI file
+            
+        Returns:
+            Dict[str, Dict[str, str]]: {section: {lowercased key: value}}
         """
+        with open(file_path, 'rb') as f:
+            return self._parse_ini_bytes(f.read())
+    
+    def _parse_ini_bytes(self, raw: bytes) -> Dict[str, Dict[str, str]]:
+        """Parse raw INI file contents, detecting the encoding"""
+        # UTF-16 needs a full decode; it's only recognisable by its BOM
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            self.logger.debug("🔧 Reading INI with utf-16 encoding")
+            return fast_ini.parse(raw.decode('utf-16'))
+        
+        # Everything else is parsed as bytes; only the extracted pieces get decoded
         try:
-            # Read file content and strip BOM if present
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                content = f.read()
-            
-            # Parse the content directly
-            config.read_string(content)
-            
-        except (UnicodeDecodeError, configparser.Error):
-            # Fallback: try with different encodings
-            for encoding in ['utf-8', 'utf-16', 'cp1252']:
+            return fast_ini.parse_bytes(raw)
+        except UnicodeDecodeError:
+            for encoding in _ENCODING_FALLBACKS:
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    config.read_string(content)
-                    self.logger.debug(f"🔧 Successfully read INI with {encoding} encoding")
-                    return
-                except (UnicodeDecodeError, configparser.Error):
+                    parsed = fast_ini.parse_bytes(raw, encoding)
+                except UnicodeDecodeError:
                     continue
-            
-            # If all encodings fail, raise the original error
+                self.logger.debug(f"🔧 Successfully read INI with {encoding} encoding")
+                return parsed
             raise
     
-    def _modify_ini_value(self, file_path: str, section: str, key: str, new_value: str) -> None:
+    def _read_ini_lines(self, file_path: str) -> List[str]:
         """
-        Modify a single INI value while preserving formatting, comments, and case
+        Read an INI file for rewriting, detecting the encoding like _parse_ini_bytes
         
-        This method reads the file line by line, finds the target key, and replaces
-        only the value part, preserving everything else.
+        Line endings are normalised to '\n', as text-mode open() would.
         
         Args:
             file_path: Path to the INI file
-            section: Section name to modify
-            key: Key name to modify (case insensitive search)
+            
+        Returns:
+            List[str]: Decoded lines, each keeping its trailing newline
+        """
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            self.logger.debug("🔧 Reading INI with utf-16 encoding")
+            text = raw.decode('utf-16')
+        else:
+            try:
+                text = raw.decode('utf-8-sig')
+            except UnicodeDecodeError:
+                for encoding in _ENCODING_FALLBACKS:
+                    try:
+                        text = raw.decode(encoding)
+                    except UnicodeDecodeError:
+                        continue
+                    self.logger.debug(f"🔧 Successfully read INI with {encoding} encoding")
+                    break
+                else:
+                    raise
+        
+        return io.StringIO(text, newline=None).readlines()
+    
+    def _get_parsed(self, file_path: str) -> Dict[str, Dict[str, str]]:
+        """
+        Return parsed INI contents, re-reading only when the file changed
+        
+        Args:
+            file_path: Path to the INI file
+            
+        Returns:
+            Dict[str, Dict[str, str]]: Parsed sections (treat as read-only)
+        """
+        st = os.stat(file_path)
+        cached = self._parse_cache.get(file_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        parsed = self._load_ini(file_path)
+        self._parse_cache[file_path] = (st.st_mtime_ns, st.st_size, parsed)
+        return parsed
+    
+    def _scan_and_modify(self, file_path: str,
+                         section_predicate: Callable[[str], bool],
+                         key_predicate: Callable[[str], bool],
+                         new_value: str) -> Optional[Tuple[str, str]]:
+        """
+        Replace the first matching INI value in a single read/modify/write pass
+        
+        Preserves formatting, comments, and key case. The file is only rewritten
+        when a matching key was found.
+        
+        Args:
+            file_path: Path to the INI file
+            section_predicate: Called with each section name, True to search it
+            key_predicate: Called with each key name, True to replace its value
             new_value: New value to set
+            
+        Returns:
+            Optional[Tuple[str, str]]: (section, key) that was modified, or None
         """
         try:
-            # Read the file with BOM handling
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                lines = f.readlines()
+            # Read the file with BOM and encoding detection
+            lines = self._read_ini_lines(file_path)
             
             # Find the section and key
             in_target_section = False
-            modified = False
+            current_section = None
+            match = None
             
             for i, line in enumerate(lines):
-                stripped = line.strip()
+                # Skip leading whitespace by index instead of allocating a stripped copy
+                ws = 0
+                n = len(line)
+                while ws < n and line[ws] in ' \t':
+                    ws += 1
+                if ws == n:
+                    continue
+                first = line[ws]
                 
                 # Check for section headers
-                if stripped.startswith('[') and stripped.endswith(']'):
-                    current_section = stripped[1:-1].strip()
-                    in_target_section = (current_section.lower() == section.lower())
-                    continue
+                if first == '[':
+                    end = len(line.rstrip()) - 1
+                    if end > ws and line[end] == ']':
+                        current_section = line[ws + 1:end].strip()
+                        in_target_section = section_predicate(current_section)
+                        continue
                 
-                # Skip if not in target section
-                if not in_target_section:
+                # Skip if not in target section, comments and empty lines
+                if not in_target_section or first in ';#\r\n':
                     continue
                 
-                # Skip comments and empty lines
-                if not stripped or stripped.startswith(';') or stripped.startswith('#'):
+                # Check if this line contains our key
+                equals_pos = line.find('=', ws)
+                if equals_pos == -1:
                     continue
                 
-                # Check if this line contains our key
-                if '=' in stripped:
-                    line_key, line_value = stripped.split('=', 1)
-                    line_key = line_key.strip()
-                    
-                    if line_key.lower() == key.lower():
-                        # Preserve the original key case and spacing
-                        # Find the '=' position in the original line
-                        equals_pos = line.find('=')
-                        if equals_pos != -1:
-                            # Reconstruct the line with new value
-                            prefix = line[:equals_pos + 1]  # Keep everything up to and including '='
-                            # Add a space after '=' if there wasn't one, preserve if there was
-                            if len(line) > equals_pos + 1 and line[equals_pos + 1] == ' ':
-                                lines[i] = f"{prefix} {new_value}\n"
-                            else:
-                                lines[i] = f"{prefix}{new_value}\n"
-                            modified = True
-                            break
+                line_key = line[ws:equals_pos].rstrip()
+                if key_predicate(line_key):
+                    # Preserve the original key case and spacing
+                    prefix = line[:equals_pos + 1]  # Keep everything up to and including '='
+                    # Keep a single space after '=' if there was one (slice is safe past the end)
+                    separator = ' ' * (line[equals_pos + 1:equals_pos + 2] == ' ')
+                    lines[i] = f"{prefix}{separator}{new_value}\n"
+                    match = (current_section, line_key)
+                    break
             
-            if not modified:
-                self.logger.warning(f"⚠️ Key '{key}' not found in section '{section}' of {file_path}")
-                return
+            if not match:
+                return None
             
             # Write the file back with preserved formatting
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.writelines(lines)
+            self._parse_cache.pop(file_path, None)
             
-            self.logger.debug(f"🔧 Modified {key} = {new_value} in [{section}]")
+            self.logger.debug(f"🔧 Modified {match[1]} = {new_value} in [{match[0]}]")
+            return match
             
         except Exception as e:
             self.logger.error(f"💥 Failed to modify INI value: {e}")
             raise
     
+    def _modify_ini_value(self, file_path: str, section: str, key: str, new_value: str) -> None:
+        """
+        Modify a single INI value while preserving formatting, comments, and case
+        
+        Args:
+            file_path: Path to the INI file
+            section: Section name to modify
+            key: Key name to modify (case insensitive search)
+            new_value: New value to set
+        """
+        section_lower = section.lower()
+        key_lower = key.lower()
+        if not self._scan_and_modify(file_path,
+                                     lambda s: s.lower() == section_lower,
+                                     lambda k: k.lower() == key_lower,
+                                     new_value):
+            self.logger.warning(f"⚠️ Key '{key}' not found in section '{section}' of {file_path}")
+    
+    def _modify_ini_values(self, file_path: str, section: str, updates: Dict[str, str]) -> None:
+        """
+        Set several values in one INI section in a single pass
+        
+        Existing keys keep their case, spacing, and surrounding comments. Keys
+        that are missing are appended at the end of the section, and the
+        section itself is appended if the file doesn't have it.
+        
+        Args:
+            file_path: Path to the INI file
+            section: Section name to modify (case insensitive)
+            updates: Key -> new value
+        """
+        lines = self._read_ini_lines(file_path)
+        
+        section_lower = section.lower()
+        pending = {key.lower(): (key, value) for key, value in updates.items()}
+        in_target_section = False
+        last_section_line = None
+        
+        for i, line in enumerate(lines):
+            ws = 0
+            n = len(line)
+            while ws < n and line[ws] in ' \t':
+                ws += 1
+            if ws == n or line[ws] in '\r\n':
+                continue
+            first = line[ws]
+            
+            # Check for section headers
+            if first == '[':
+                end = len(line.rstrip()) - 1
+                if end > ws and line[end] == ']':
+                    in_target_section = line[ws + 1:end].strip().lower() == section_lower
+                    if in_target_section:
+                        last_section_line = i
+                    continue
+            
+            if not in_target_section:
+                continue
+            last_section_line = i
+            
+            if first in ';#':
+                continue
+            
+            equals_pos = line.find('=', ws)
+            if equals_pos == -1:
+                continue
+            
+            line_key = line[ws:equals_pos].rstrip().lower()
+            if line_key in pending:
+                _, new_value = pending.pop(line_key)
+                separator = ' ' * (line[equals_pos + 1:equals_pos + 2] == ' ')
+                lines[i] = f"{line[:equals_pos + 1]}{separator}{new_value}\n"
+        
+        if pending:
+            missing = [f"{key} = {value}\n" for key, value in pending.values()]
+            if last_section_line is None:
+                if lines and not lines[-1].endswith('\n'):
+                    lines[-1] += '\n'
+                lines.append(f"[{section}]\n")
+                lines.extend(missing)
+            else:
+                if not lines[last_section_line].endswith('\n'):
+                    lines[last_section_line] += '\n'
+                lines[last_section_line + 1:last_section_line + 1] = missing
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(lines))
+        self._parse_cache.pop(file_path, None)
+        
+        self.logger.debug(f"🔧 Updated {len(updates)} values in [{section}]")
+    
     def backup_all_configs(self) -> bool:
         """
         Create backups of all configuration files
@@ -205,26 +391,36 @@ class ConfigManager:
             os.makedirs(self.backup_directory, exist_ok=True)
             
             backup_success = True
-            for config_name, config_path in self.config_files.items():
-                if os.path.exists(config_path):
-                    backup_path = os.path.join(
-                        self.backup_directory, 
-                        f"{config_name}_{os.path.basename(config_path)}"
-                    )
-                    
-                    try:
-                        shutil.copy2(config_path, backup_path)
-                        self.logger.info(f"✅ Backed up {config_name}")
-                        
-                        # Store original content for quick restore
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            self.original_configs[config_name] = f.read()
+            with tarfile.open(self.backup_archive, 'w') as tar:
+                for config_name, config_path in self.config_files.items():
+                    if self._config_exists.get(config_name):
+                        try:
+                            # Read once: the same bytes feed the tar member and the in-memory copy
+                            st = os.stat(config_path)
+                            with open(config_path, 'rb') as f:
+                                data = f.read()
                             
-                    except Exception as e:
-                        self.logger.error(f"❌ Failed to backup {config_name}: {e}")
-                        backup_success = False
-                else:
-                    self.logger.warning(f"⚠️ Config file not found: {config_name} ({config_path})")
+                            member = tarfile.TarInfo(f"{config_name}_{os.path.basename(config_path)}")
+                            member.size = len(data)
+                            member.mtime = st.st_mtime
+                            tar.addfile(member, io.BytesIO(data))
+                            self.logger.info(f"✅ Backed up {config_name}")
+                            
+                            # Store original bytes for quick restore
+                            self.original_configs[config_name] = data
+                            
+                            # Seed the parse cache so later lookups don't read the file again
+                            try:
+                                parsed = self._parse_ini_bytes(data)
+                                self._parse_cache[config_path] = (st.st_mtime_ns, st.st_size, parsed)
+                            except UnicodeDecodeError:
+                                pass
+                                
+                        except Exception as e:
+                            self.logger.error(f"❌ Failed to backup {config_name}: {e}")
+                            backup_success = False
+                    else:
+                        self.logger.warning(f"⚠️ Config file not found: {config_name} ({config_path})")
             
             if backup_success:
                 self.logger.info("✅ All configuration files backed up successfully")
@@ -255,8 +451,8 @@ class ConfigManager:
         
         self.logger.info(f"🌱 Setting season to: {season_name} (type {season_type})")
         
-        seasons_config_path = self.config_files.get("seasons_config")
-        if not seasons_config_path or not os.path.exists(seasons_config_path):
+        seasons_config_path, seasons_config_exists = self._path_if_exists("seasons_config")
+        if not seasons_config_exists:
             if season_type == 5:  # Restoration to seasonal mode
                 self.logger.warning("⚠️ Seasons of Skyrim config file not found - cannot restore seasonal mode")
                 return True  # Don't fail restoration for this
@@ -267,36 +463,15 @@ class ConfigManager:
                 return False
         
         try:
-            # Read current configuration with BOM handling
-            config = configparser.ConfigParser()
-            self._read_config_with_bom_handling(config, seasons_config_path)
-            
-            # Find the correct section (usually [Settings] or [General])
-            target_section = None
-            for section_name in config.sections():
-                if 'season type' in [key.lower() for key in config[section_name].keys()]:
-                    target_section = section_name
-                    break
-            
-            if not target_section:
-                # Create Settings section if it doesn't exist
-                target_section = "Settings"
-                if target_section not in config:
-                    config.add_section(target_section)
-            
-            # Set the season type
-            # Handle different possible key names
-            season_key = None
-            for key in config[target_section].keys():
-                if key.lower() in ['season type', 'seasontype', 'season']:
-                    season_key = key
-                    break
-            
-            if not season_key:
-                season_key = "Season Type"
+            # Find and replace the season key in one pass (any section, usually [Settings] or [General])
+            modified = self._scan_and_modify(seasons_config_path,
+                                             lambda section: True,
+                                             lambda key: key.lower() in self._SEASON_KEYS,
+                                             str(season_type))
             
-            # Use careful modification to preserve formatting
-            self._modify_ini_value(seasons_config_path, target_section, season_key, str(season_type))
+            if not modified:
+                # No season key anywhere - add it to [Settings] (created only if missing)
+                self._modify_ini_values(seasons_config_path, "Settings", {"Season Type": str(season_type)})
             
             self.logger.info(f"✅ Successfully set season to {season_name}")
             return True
@@ -330,19 +505,12 @@ class ConfigManager:
         """
         self.logger.info("⚙️ Configuring NGIO for grass generation...")
         
-        ngio_config_path = self.config_files.get("ngio_config")
-        if not ngio_config_path or not os.path.exists(ngio_config_path):
+        ngio_config_path, ngio_config_exists = self._path_if_exists("ngio_config")
+        if not ngio_config_exists:
             self.logger.error("❌ NGIO GrassControl.ini not found")
             return False
         
         try:
-            config = configparser.ConfigParser()
-            self._read_config_with_bom_handling(config, ngio_config_path)
-            
-            # Ensure [Settings] section exists
-            if "Settings" not in config:
-                config.add_section("Settings")
-            
             # Core settings (always set)
             ngio_settings = {
                 "UseGrassCache": "True",
@@ -369,13 +537,8 @@ class ConfigManager:
             if only_pregenerate_worldspaces:
                 ngio_settings["OnlyPregenerateWorldSpaces"] = only_pregenerate_worldspaces
             
-            # Apply all settings
-            for key, value in ngio_settings.items():
-                config["Settings"][key] = value
-            
-            # Write updated configuration
-            with open(ngio_config_path, 'w', encoding='utf-8') as f:
-                config.write(f)
+            # Apply all settings in one pass, keeping user comments and formatting
+            self._modify_ini_values(ngio_config_path, "Settings", ngio_settings)
             
             # Log important settings
             self.logger.info("✅ NGIO configured for grass generation")
@@ -403,19 +566,12 @@ class ConfigManager:
         """
         self.logger.info("⚙️ Configuring NGIO for cache usage...")
         
-        ngio_config_path = self.config_files.get("ngio_config")
-        if not ngio_config_path or not os.path.exists(ngio_config_path):
+        ngio_config_path, ngio_config_exists = self._path_if_exists("ngio_config")
+        if not ngio_config_exists:
             self.logger.error("❌ NGIO GrassControl.ini not found")
             return False
         
         try:
-            config = configparser.ConfigParser()
-            self._read_config_with_bom_handling(config, ngio_config_path)
-            
-            # Ensure [Settings] section exists
-            if "Settings" not in config:
-                config.add_section("Settings")
-            
             # Configure NGIO for cache usage only
             ngio_settings = {
                 "UseGrassCache": "1",
@@ -424,12 +580,7 @@ class ConfigManager:
                 "EnableGrassGeneration": "0"
             }
             
-            for key, value in ngio_settings.items():
-                config["Settings"][key] = value
-            
-            # Write updated configuration
-            with open(ngio_config_path, 'w', encoding='utf-8') as f:
-                config.write(f)
+            self._modify_ini_values(ngio_config_path, "Settings", ngio_settings)
             
             self.logger.info("✅ NGIO configured for cache usage")
             return True
@@ -451,47 +602,30 @@ class ConfigManager:
         
         # Check if all config files exist
         for config_name, config_path in self.config_files.items():
-            if not os.path.exists(config_path):
+            if not self._config_exists.get(config_name):
                 issues.append(f"Missing config file: {config_name} ({config_path})")
         
         # Validate Seasons of Skyrim configuration
-        seasons_config_path = self.config_files.get("seasons_config")
-        if seasons_config_path and os.path.exists(seasons_config_path):
+        if self._config_exists.get("seasons_config"):
             try:
-                config = configparser.ConfigParser()
-                self._read_config_with_bom_handling(config, seasons_config_path)
+                config = self._get_parsed(self.config_files["seasons_config"])
+                present = {key for values in config.values() for key in values}
                 
-                # Check if season type setting exists
-                season_type_found = False
-                for section in config.sections():
-                    for key in config[section].keys():
-                        if key.lower() in ['season type', 'seasontype', 'season']:
-                            season_type_found = True
-                            break
-                    if season_type_found:
-                        break
-                
-                if not season_type_found:
+                if not present & self._SEASON_KEYS:
                     issues.append("Season Type setting not found in po3_SeasonsOfSkyrim.ini")
                     
             except Exception as e:
                 issues.append(f"Error reading seasons config: {e}")
         
         # Validate NGIO configuration
-        ngio_config_path = self.config_files.get("ngio_config")
-        if ngio_config_path and os.path.exists(ngio_config_path):
+        if self._config_exists.get("ngio_config"):
             try:
-                config = configparser.ConfigParser()
-                self._read_config_with_bom_handling(config, ngio_config_path)
+                config = self._get_parsed(self.config_files["ngio_config"])
+                present = {key for values in config.values() for key in values}
                 
                 required_settings = ["UseGrassCache", "DynDOLODGrassMode"]
                 for setting in required_settings:
-                    found = False
-                    for section in config.sections():
-                        if setting in config[section]:
-                            found = True
-                            break
-                    if not found:
+                    if setting.lower() not in present:
                         issues.append(f"Missing NGIO setting: {setting}")
                         
             except Exception as e:
@@ -517,38 +651,36 @@ class ConfigManager:
         """
         self.logger.info("🔄 Restoring original configurations...")
         
-        if not self.backup_directory or not os.path.exists(self.backup_directory):
-            self.logger.error("❌ No backup directory found")
+        has_archive = bool(self.backup_archive) and os.path.exists(self.backup_archive)
+        if not has_archive and not self.original_configs:
+            self.logger.error("❌ No backup archive found")
             return False
         
         restore_success = True
+        self._parse_cache.clear()
         
         try:
+            # Bytes kept from backup_all_configs need no disk read; the archive covers the rest
+            backups = dict(self.original_configs)
+            if has_archive and any(name not in backups for name in self.config_files):
+                with tarfile.open(self.backup_archive, 'r') as tar:
+                    members = {member.name: member for member in tar.getmembers()}
+                    for config_name, config_path in self.config_files.items():
+                        member = members.get(f"{config_name}_{os.path.basename(config_path)}")
+                        if config_name not in backups and member is not None:
+                            backups[config_name] = tar.extractfile(member).read()
+            
             for config_name, config_path in self.config_files.items():
-                backup_path = os.path.join(
-                    self.backup_directory, 
-                    f"{config_name}_{os.path.basename(config_path)}"
-                )
-                
-                if os.path.exists(backup_path):
+                if config_name in backups:
                     try:
-                        shutil.copy2(backup_path, config_path)
+                        with open(config_path, 'wb') as f:
+                            f.write(backups[config_name])
                         self.logger.info(f"✅ Restored {config_name}")
                     except Exception as e:
                         self.logger.error(f"❌ Failed to restore {config_name}: {e}")
                         restore_success = False
                 else:
-                    # Try to restore from memory if backup file missing
-                    if config_name in self.original_configs:
-                        try:
-                            with open(config_path, 'w', encoding='utf-8') as f:
-                                f.write(self.original_configs[config_name])
-                            self.logger.info(f"✅ Restored {config_name} from memory")
-                        except Exception as e:
-                            self.logger.error(f"❌ Failed to restore {config_name} from memory: {e}")
-                            restore_success = False
-                    else:
-                        self.logger.warning(f"⚠️ No backup found for {config_name}")
+                    self.logger.warning(f"⚠️ No backup found for {config_name}")
             
             if restore_success:
                 self.logger.info("✅ All configurations restored successfully")
@@ -566,18 +698,17 @@ class ConfigManager:
         Returns:
             Optional[int]: Current season type, or None if not found
         """
-        seasons_config_path = self.config_files.get("seasons_config")
-        if not seasons_config_path or not os.path.exists(seasons_config_path):
+        seasons_config_path, seasons_config_exists = self._path_if_exists("seasons_config")
+        if not seasons_config_exists:
             return None
         
         try:
-            config = configparser.ConfigParser()
-            self._read_config_with_bom_handling(config, seasons_config_path)
+            config = self._get_parsed(seasons_config_path)
             
             # Find season type setting
-            for section in config.sections():
-                for key, value in config[section].items():
-                    if key.lower() in ['season type', 'seasontype', 'season']:
+            for values in config.values():
+                for key, value in values.items():
+                    if key in self._SEASON_KEYS:
                         return int(value)
             
             return None
@@ -588,10 +719,10 @@ class ConfigManager:
     
     def cleanup_backups(self, keep_latest: int = 3) -> None:
         """
-        Clean up old backup directories, keeping only the latest ones
+        Clean up old backups, keeping only the latest ones
         
         Args:
-            keep_latest: Number of backup directories to keep
+            keep_latest: Number of backups to keep
         """
         if not self.skyrim_path:
             return
@@ -601,12 +732,13 @@ class ConfigManager:
             return
         
         try:
-            # Get all backup directories
-            backup_dirs = []
-            for item in os.listdir(backup_root):
-                item_path = os.path.join(backup_root, item)
-                if os.path.isdir(item_path) and item.startswith("backup_"):
-                    backup_dirs.append((item_path, os.path.getctime(item_path)))
+            # Get all backup archives (and directories from older versions)
+            with os.scandir(backup_root) as it:
+                backup_dirs = [
+                    (entry.path, entry.stat().st_ctime) for entry in it
+                    if entry.name.startswith("backup_")
+                    and (entry.name.endswith(".tar") or entry.is_dir(follow_symlinks=False))
+                ]
             
             # Sort by creation time (newest first)
             backup_dirs.sort(key=lambda x: x[1], reverse=True)
@@ -614,7 +746,10 @@ class ConfigManager:
             # Remove old backups
             for backup_path, _ in backup_dirs[keep_latest:]:
                 try:
-                    shutil.rmtree(backup_path)
+                    if backup_path.endswith(".tar"):
+                        os.unlink(backup_path)
+                    else:
+                        shutil.rmtree(backup_path)
                     self.logger.info(f"🗑️ Removed old backup: {os.path.basename(backup_path)}")
                 except Exception as e:
                     self.logger.warning(f"Failed to remove backup {backup_path}: {e}")
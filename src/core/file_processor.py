@@ -7,10 +7,10 @@ Handles fast renaming and organization of grass cache files
 import os
 import shutil
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import List, Dict, Tuple, Optional, Callable, Iterator, Iterable
 import time
+from itertools import islice
 from dataclasses import dataclass
 
 try:
@@ -22,6 +22,37 @@ except ImportError:
 from ..utils.logger import Logger
 
 
+# Upper bound on operations handled by one worker task
+_OPERATION_CHUNK_SIZE = 256
+
+_MOD_META_INI_TEMPLATE = """[General]
+modid=0
+version=1.0
+newestVersion=1.0
+category=23
+installationFile=Generated by NGIO Automation Suite
+
+[installedFiles]
+size={file_count}
+"""
+
+_MOD_README_TEMPLATE = """Grass Cache - {display_name}
+========================================
+
+Generated by NGIO Automation Suite
+Season: {display_name} (Type {season_type})
+Files: {file_count} grass cache files
+Extension: {extension}
+Generated: {timestamp}
+
+Installation:
+1. Enable this mod in your mod manager
+2. Ensure Grass Cache Helper NG is installed and active
+3. Disable NGIO mod
+4. Launch Skyrim and enjoy seasonal grass!
+"""
+
+
 @dataclass
 class FileOperation:
     """Represents a single file operation"""
@@ -88,7 +119,7 @@ class FileProcessor:
         start_time = time.time()
         
         # Find all .cgid files
-        cgid_files = self._find_cgid_files(grass_directory)
+        cgid_files = list(self._iter_cgid_files(grass_directory))
         if not cgid_files:
             self.logger.warning("⚠️  No .cgid files found in grass directory")
             return ProcessingResult(
@@ -101,11 +132,26 @@ class FileProcessor:
         
         self.logger.info(f"📁 Found {len(cgid_files)} grass cache files to process")
         
-        # Create file operations
-        operations = self._create_rename_operations(cgid_files, season)
+        # SAFETY CHECK: Skip files that already have the correct seasonal extension
+        # This prevents double postfixes (e.g., .SPR.SPR.cgid) on resume
+        extension = season.extension
+        to_rename = [path for path in cgid_files if not path.endswith(extension)]
+        if len(to_rename) < len(cgid_files):
+            self.logger.debug(f"Skipping {len(cgid_files) - len(to_rename)} already-renamed files")
+        
+        # Operations are built lazily and submitted as workers free up
+        operations = (
+            FileOperation(
+                source_path=path,
+                target_path=path[:-5] + extension,  # Replace .cgid with the seasonal extension
+                operation_type="rename",
+                season_extension=extension
+            )
+            for path in to_rename
+        )
         
         # Execute operations with multithreading
-        result = self._execute_operations(operations, progress_callback)
+        result = self._execute_operations(operations, progress_callback, total_operations=len(to_rename))
         
         # Update statistics
         duration = time.time() - start_time
@@ -121,62 +167,49 @@ class FileProcessor:
             
         return result
     
-    def _find_cgid_files(self, directory: str) -> List[str]:
-        """Find all .cgid files in directory and subdirectories"""
-        cgid_files = []
+    def _iter_files(self, directory: str) -> Iterator[os.DirEntry]:
+        """
+        Yield a DirEntry for every file in directory and subdirectories
         
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.lower().endswith('.cgid'):
-                        full_path = os.path.join(root, file)
-                        cgid_files.append(full_path)
-        except Exception as e:
-            self.logger.error(f"Error scanning directory {directory}: {e}")
-            
-        return cgid_files
+        os.scandir stack walk: file/dir checks use the cached directory entry
+        data instead of an extra stat per file.
+        """
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError as e:
+                self.logger.error(f"Error scanning directory {current}: {e}")
     
-    def _create_rename_operations(self, file_paths: List[str], season) -> List[FileOperation]:
-        """Create rename operations for season-specific extensions"""
-        operations = []
-        
-        for file_path in file_paths:
-            # Create target path with season extension
-            path_obj = Path(file_path)
-            filename = path_obj.name
-            
-            # SAFETY CHECK: Skip if file already has the correct seasonal extension
-            # This prevents double postfixes (e.g., .SPR.SPR.cgid) on resume
-            if filename.endswith(season.extension):
-                self.logger.debug(f"Skipping already-renamed file: {filename}")
-                continue
-            
-            # Remove existing .cgid extension and add seasonal extension
-            base_name = path_obj.stem
-            target_name = f"{base_name}{season.extension}"
-            target_path = path_obj.parent / target_name
-            
-            operation = FileOperation(
-                source_path=file_path,
-                target_path=str(target_path),
-                operation_type="rename",
-                season_extension=season.extension
-            )
-            operations.append(operation)
-            
-        return operations
+    def _iter_cgid_files(self, directory: str) -> Iterator[str]:
+        """Yield paths of all .cgid files in directory and subdirectories"""
+        for entry in self._iter_files(directory):
+            if entry.name[-5:].lower() == '.cgid':
+                yield entry.path
     
-    def _execute_operations(self, operations: List[FileOperation], 
-                          progress_callback: Optional[Callable] = None) -> ProcessingResult:
-        """Execute file operations using multithreading with progress bar (v1.2.0+)"""
+    def _execute_operations(self, operations: Iterable[FileOperation], 
+                          progress_callback: Optional[Callable] = None,
+                          total_operations: Optional[int] = None) -> ProcessingResult:
+        """
+        Execute file operations using multithreading with progress bar (v1.2.0+)
+        
+        Operations may be a lazy iterable (pass total_operations then); only a
+        bounded window of them is in flight at any time.
+        """
         processed_files = 0
         failed_files = 0
         errors = []
-        total_operations = len(operations)
+        if total_operations is None:
+            total_operations = len(operations)
         
         # Update largest batch size stat
-        if total_operations > self.stats["largest_batch_size"]:
-            self.stats["largest_batch_size"] = total_operations
+        self.stats["largest_batch_size"] = max(self.stats["largest_batch_size"], total_operations)
         
         # Create progress bar if tqdm is available (v1.2.0+)
         if _TQDM_AVAILABLE and not progress_callback:
@@ -191,45 +224,55 @@ class FileProcessor:
         else:
             pbar = None
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all operations
-            future_to_operation = {
-                executor.submit(self._execute_single_operation, op): op 
-                for op in operations
-            }
+        # Report roughly every 1% to a callback and every 10% to the log
+        progress_step = max(1, total_operations // (100 if progress_callback else 10))
+        next_progress = progress_step
+        
+        def handle_completed(future) -> None:
+            nonlocal processed_files, failed_files, next_progress
             
-            # Process completed operations
-            for future in as_completed(future_to_operation):
-                operation = future_to_operation[future]
-                
-                try:
-                    success, error_msg = future.result()
-                    
-                    if success:
-                        processed_files += 1
-                    else:
-                        failed_files += 1
-                        if error_msg:
-                            errors.append(f"{operation.source_path}: {error_msg}")
-                            
-                except Exception as e:
-                    failed_files += 1
-                    errors.append(f"{operation.source_path}: Unexpected error: {e}")
-                
-                # Update progress
-                completed = processed_files + failed_files
-                
-                if pbar:
-                    # Update tqdm progress bar
-                    pbar.update(1)
-                elif progress_callback:
+            chunk_processed, chunk_failed, chunk_errors = future.result()
+            processed_files += chunk_processed
+            failed_files += chunk_failed
+            errors.extend(chunk_errors)
+            
+            # Update progress
+            completed = processed_files + failed_files
+            
+            if pbar:
+                # Update tqdm progress bar
+                pbar.update(chunk_processed + chunk_failed)
+            elif completed >= next_progress or completed == total_operations:
+                if progress_callback:
                     # Use custom callback
                     progress_callback(completed, total_operations)
-                elif completed % max(1, total_operations // 10) == 0:
+                else:
                     # Fallback: Log progress every 10%
                     self.logger.progress(
                         f"Processing files", completed, total_operations
                     )
+                next_progress = completed - completed % progress_step + progress_step
+        
+        # One task per chunk of operations rather than one future per file, but
+        # small enough that every worker still gets a share of small batches
+        chunk_size = max(1, min(_OPERATION_CHUNK_SIZE, total_operations // (self.max_workers * 4)))
+        max_in_flight = self.max_workers * 2
+        pending = iter(operations)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = set()
+            
+            for chunk in iter(lambda: list(islice(pending, chunk_size)), []):
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle_completed(future)
+                
+                in_flight.add(executor.submit(self._execute_chunk, chunk))
+            
+            # Process remaining chunks
+            for future in as_completed(in_flight):
+                handle_completed(future)
         
         # Close progress bar
         if pbar:
@@ -246,21 +289,30 @@ class FileProcessor:
             errors=errors
         )
     
+    def _execute_chunk(self, operations: List[FileOperation]) -> Tuple[int, int, List[str]]:
+        """Execute a chunk of operations on one worker, returning (processed, failed, errors)"""
+        processed = 0
+        errors = []
+        
+        for operation in operations:
+            try:
+                success, error_msg = self._execute_single_operation(operation)
+            except Exception as e:
+                success, error_msg = False, f"Unexpected error: {e}"
+            
+            if success:
+                processed += 1
+            elif error_msg:
+                errors.append(f"{operation.source_path}: {error_msg}")
+        
+        return processed, len(operations) - processed, errors
+    
     def _execute_single_operation(self, operation: FileOperation) -> Tuple[bool, Optional[str]]:
         """Execute a single file operation"""
         try:
             if operation.operation_type == "rename":
-                # Check if source file exists
-                if not os.path.exists(operation.source_path):
-                    return False, "Source file does not exist"
-                
-                # Check if target already exists
-                if os.path.exists(operation.target_path):
-                    # Remove existing target file
-                    os.remove(operation.target_path)
-                
-                # Perform rename
-                os.rename(operation.source_path, operation.target_path)
+                # Atomic rename that overwrites an existing target in one call
+                os.replace(operation.source_path, operation.target_path)
                 return True, None
                 
             elif operation.operation_type == "copy":
@@ -308,34 +360,27 @@ class FileProcessor:
             
             os.makedirs(grass_directory, exist_ok=True)
             
-            # Find seasonal grass files
+            # Find seasonal grass files and build the copy operations in the same pass
             source_grass_dir = os.path.join(output_directory, "Data", "Grass")
-            if not os.path.exists(source_grass_dir):
+            extension = season.extension
+            operations = []
+            try:
+                with os.scandir(source_grass_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(extension) and entry.is_file(follow_symlinks=False):
+                            operations.append(FileOperation(
+                                source_path=entry.path,
+                                target_path=os.path.join(grass_directory, entry.name),
+                                operation_type="copy"
+                            ))
+            except FileNotFoundError:
                 self.logger.error(f"❌ Source grass directory not found: {source_grass_dir}")
                 return False
             
-            # Move seasonal files to mod folder
-            seasonal_files = []
-            for file in os.listdir(source_grass_dir):
-                if file.endswith(season.extension):
-                    seasonal_files.append(file)
-            
-            if not seasonal_files:
+            if not operations:
                 self.logger.warning(f"⚠️  No seasonal files found for {season.display_name}")
                 return False
             
-            # Copy files to mod folder
-            operations = []
-            for file in seasonal_files:
-                source_path = os.path.join(source_grass_dir, file)
-                target_path = os.path.join(grass_directory, file)
-                
-                operations.append(FileOperation(
-                    source_path=source_path,
-                    target_path=target_path,
-                    operation_type="copy"
-                ))
-            
             # Execute copy operations
             result = self._execute_operations(operations)
             
@@ -343,7 +388,7 @@ class FileProcessor:
                 self.logger.success(f"✅ Created mod folder with {result.processed_files} files")
                 
                 # Create mod metadata file
-                self._create_mod_metadata(mod_directory, season, len(seasonal_files))
+                self._create_mod_metadata(mod_directory, season, len(operations))
                 
                 return True
             else:
@@ -357,33 +402,24 @@ class FileProcessor:
     def _create_mod_metadata(self, mod_directory: str, season, file_count: int) -> None:
         """Create mod metadata files"""
         try:
-            # Create meta.ini for Mod Organizer 2
-            meta_file = os.path.join(mod_directory, "meta.ini")
-            with open(meta_file, 'w', encoding='utf-8') as f:
-                f.write("[General]\n")
-                f.write(f"modid=0\n")
-                f.write(f"version=1.0\n")
-                f.write(f"newestVersion=1.0\n")
-                f.write(f"category=23\n")  # Environment category
-                f.write(f"installationFile=Generated by NGIO Automation Suite\n")
-                f.write(f"\n[installedFiles]\n")
-                f.write(f"size={file_count}\n")
-            
-            # Create readme with generation info
-            readme_file = os.path.join(mod_directory, "README.txt")
-            with open(readme_file, 'w', encoding='utf-8') as f:
-                f.write(f"Grass Cache - {season.display_name}\n")
-                f.write("=" * 40 + "\n\n")
-                f.write("Generated by NGIO Automation Suite\n")
-                f.write(f"Season: {season.display_name} (Type {season.season_type})\n")
-                f.write(f"Files: {file_count} grass cache files\n")
-                f.write(f"Extension: {season.extension}\n")
-                f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write("Installation:\n")
-                f.write("1. Enable this mod in your mod manager\n")
-                f.write("2. Ensure Grass Cache Helper NG is installed and active\n")
-                f.write("3. Disable NGIO mod\n")
-                f.write("4. Launch Skyrim and enjoy seasonal grass!\n")
+            # Each file is rendered and encoded up front, then written in one call
+            files = {
+                # meta.ini for Mod Organizer 2 (category 23 = Environment)
+                "meta.ini": _MOD_META_INI_TEMPLATE.format(file_count=file_count),
+                # readme with generation info
+                "README.txt": _MOD_README_TEMPLATE.format(
+                    display_name=season.display_name,
+                    season_type=season.season_type,
+                    file_count=file_count,
+                    extension=season.extension,
+                    timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
+                ),
+            }
+            
+            for filename, content in files.items():
+                payload = content.replace("\n", os.linesep).encode('utf-8')
+                with open(os.path.join(mod_directory, filename), 'wb') as f:
+                    f.write(payload)
             
             self.logger.debug(f"📝 Created mod metadata files")
             
@@ -401,25 +437,26 @@ class FileProcessor:
             bool: True if file appears valid, False if corrupted
         """
         try:
-            if not os.path.exists(file_path):
-                return False
-            
-            # Check file size (grass cache files should not be empty)
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
+            # One stat covers both existence and size (grass cache files should not be empty)
+            if os.stat(file_path).st_size == 0:
                 return False
             
             # Basic header validation for .cgid files
-            with open(file_path, 'rb') as f:
-                header = f.read(8)
-                
-                # Check for common .cgid patterns
-                # This is a simplified check - real validation would be more complex
-                if len(header) < 8:
-                    return False
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                header = os.read(fd, 8)
+            finally:
+                os.close(fd)
+            
+            # Check for common .cgid patterns
+            # This is a simplified check - real validation would be more complex
+            if len(header) < 8:
+                return False
             
             return True
             
+        except FileNotFoundError:
+            return False
         except Exception as e:
             self.logger.debug(f"File validation error for {file_path}: {e}")
             return False
@@ -438,16 +475,14 @@ class FileProcessor:
         cleaned_files = 0
         
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith('.tmp') or file.endswith('.temp'):
-                        file_path = os.path.join(root, file)
-                        try:
-                            os.remove(file_path)
-                            cleaned_files += 1
-                        except Exception as e:
-                            self.logger.debug(f"Failed to remove temp file {file_path}: {e}")
-                            
+            for entry in self._iter_files(directory):
+                if entry.name.endswith(('.tmp', '.temp')):
+                    try:
+                        os.remove(entry.path)
+                        cleaned_files += 1
+                    except Exception as e:
+                        self.logger.debug(f"Failed to remove temp file {entry.path}: {e}")
+                        
         except Exception as e:
             self.logger.warning(f"Error during cleanup: {e}")
         
@@ -525,31 +560,19 @@ class FileProcessor:
         os.makedirs(target_directory, exist_ok=True)
         
         # Create copy operations with extension stripping
-        operations = []
+        # Every file ends with season_extension (e.g. ".WIN.cgid"), so slicing it off
+        # and appending ".cgid" gives the LOD name: "file.WIN.cgid" -> "file.cgid"
+        strip_length = len(season_extension)
         
-        # Determine the seasonal suffix to strip (e.g., ".WIN" from ".WIN.cgid")
-        # Season extensions are like ".WIN.cgid", ".SPR.cgid", etc.
-        # We want to convert to just ".cgid"
-        season_suffix = season_extension.replace(".cgid", "")  # Gets ".WIN", ".SPR", etc.
-        
-        for source_file in seasonal_files:
-            filename = os.path.basename(source_file)
-            
-            # Strip the seasonal suffix: "file.WIN.cgid" -> "file.cgid"
-            if season_suffix in filename:
-                new_filename = filename.replace(season_suffix, "")
-            else:
-                # Fallback: just use original name (shouldn't happen)
-                new_filename = filename
-            
-            target_path = os.path.join(target_directory, new_filename)
-            
-            operations.append(FileOperation(
+        operations = [
+            FileOperation(
                 source_path=source_file,
-                target_path=target_path,
+                target_path=os.path.join(target_directory, os.path.basename(source_file)[:-strip_length] + ".cgid"),
                 operation_type="copy",
                 season_extension=season_extension
-            ))
+            )
+            for source_file in seasonal_files
+        ]
         
         self.logger.info(f"⚡ Processing {len(operations)} files for LOD grass cache...")
         
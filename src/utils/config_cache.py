@@ -102,6 +102,9 @@ class ConfigCache:
         self.paths = UserPaths()
         self.preferences = UserPreferences()
         
+        # mtime of the config file the in-memory state matches (None = not loaded)
+        self._loaded_mtime: Optional[int] = None
+        
         self.logger.info(f"📁 Config cache location: {self.config_file}")
     
     def load_config(self) -> bool:
@@ -111,10 +114,16 @@ class ConfigCache:
         Returns:
             bool: True if config loaded successfully, False if new config needed
         """
-        if not os.path.exists(self.config_file):
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
             self.logger.info("📝 No existing configuration found")
             return False
         
+        # Unchanged since the last load/save - in-memory state is current
+        if mtime == self._loaded_mtime:
+            return True
+        
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
@@ -127,6 +136,7 @@ class ConfigCache:
             if 'preferences' in config_data:
                 self.preferences = UserPreferences(**config_data['preferences'])
             
+            self._loaded_mtime = mtime
             self.logger.info("✅ Configuration loaded successfully")
             return True
             
@@ -184,6 +194,7 @@ class ConfigCache:
             # Save to file
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, indent=2, ensure_ascii=False)
+            self._loaded_mtime = os.stat(self.config_file).st_mtime_ns
             
             self.logger.info("💾 Configuration saved successfully")
             return True
@@ -540,6 +551,7 @@ class ConfigCache:
             
             self.paths = UserPaths()
             self.preferences = UserPreferences()
+            self._loaded_mtime = None
             
             self.logger.info("🔄 Configuration reset to defaults")
             return True
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Fast INI Parser - Lightweight Read-Only INI Parsing
+Parses simple section/key=value INI files without configparser overhead
+"""
+
+import re
+import codecs
+from typing import Dict
+
+
+_SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^;#=\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+# Same patterns for undecoded file contents
+_SECTION_RE_B = re.compile(rb'^\s*\[([^\]\r\n]+)\]\s*$')
+_KV_RE_B = re.compile(rb'^\s*([^;#=\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+
+def parse(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse INI text into a {section: {key: value}} dictionary
+    
+    Keys are lowercased like configparser's default optionxform, section
+    names keep their case. Comments, blank lines and keys outside any
+    section are ignored; later duplicates win.
+    
+    Args:
+        text: INI file content (BOM already stripped)
+    
+    Returns:
+        Dict[str, Dict[str, str]]: Parsed sections
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current = None
+    
+    for line in text.splitlines():
+        match = _SECTION_RE.match(line)
+        if match:
+            current = sections.setdefault(match.group(1).strip(), {})
+            continue
+        
+        if current is None:
+            continue
+        
+        match = _KV_RE.match(line)
+        if match:
+            current[match.group(1).lower()] = match.group(2)
+    
+    return sections
+
+
+def parse_bytes(raw: bytes, encoding: str = 'utf-8') -> Dict[str, Dict[str, str]]:
+    """
+    Parse undecoded INI contents, decoding only section names, keys and values
+    
+    Comment and blank lines are never decoded, so the whole-file decode pass
+    is skipped. A UTF-8 BOM is ignored. Raises UnicodeDecodeError if an
+    extracted piece isn't valid in the given encoding.
+    
+    Args:
+        raw: INI file bytes (ASCII-compatible encoding)
+        encoding: Encoding used for the extracted pieces
+    
+    Returns:
+        Dict[str, Dict[str, str]]: Parsed sections, same shape as parse()
+    """
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    
+    sections: Dict[str, Dict[str, str]] = {}
+    current = None
+    
+    for line in raw.split(b'\n'):
+        match = _SECTION_RE_B.match(line)
+        if match:
+            current = sections.setdefault(match.group(1).strip().decode(encoding), {})
+            continue
+        
+        if current is None:
+            continue
+        
+        match = _KV_RE_B.match(line)
+        if match:
+            current[match.group(1).decode(encoding).lower()] = match.group(2).decode(encoding)
+    
+    return sections
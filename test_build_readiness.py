@@ -135,6 +135,82 @@ def test_pyinstaller():
         print(f"   ❌ PyInstaller error: {e}")
         return False
 
+def test_utf16_ini_update():
+    """Check NGIO settings can be written into a UTF-16 GrassControl.ini."""
+    print("\n🔍 Checking UTF-16 INI updates...")
+    
+    import tempfile
+    import configparser
+    
+    try:
+        sys.path.insert(0, str(Path(__file__).parent))
+        from src.core.config_manager import ConfigManager
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ini_path = Path(temp_dir) / 'GrassControl.ini'
+            ini_path.write_bytes("[Settings]\r\nUseGrassCache = 0\r\n".encode('utf-16'))
+            
+            manager = ConfigManager(temp_dir)
+            manager.config_files['ngio_config'] = str(ini_path)
+            manager._config_exists['ngio_config'] = True
+            if not manager.configure_ngio_for_cache_use():
+                print("   ❌ configure_ngio_for_cache_use failed on a UTF-16 file")
+                return False
+            
+            # Written back as UTF-8, like the old ConfigParser path
+            parser = configparser.ConfigParser()
+            parser.read(ini_path, encoding='utf-8')
+            if parser['Settings'].get('UseGrassCache') != '1':
+                print("   ❌ UseGrassCache was not updated")
+                return False
+        
+        print("   ✅ UTF-16 GrassControl.ini updated")
+        return True
+    except Exception as e:
+        print(f"   ❌ UTF-16 INI update error: {e}")
+        return False
+
+def test_release_zip_roundtrip():
+    """Check _parallel_zip archives pass zipfile.testzip()."""
+    print("\n🔍 Checking release ZIP round trip...")
+    
+    import os
+    import tempfile
+    import zipfile
+    
+    try:
+        sys.path.insert(0, str(Path(__file__).parent))
+        import build_release
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            small = temp_dir / 'small.txt'
+            small.write_bytes(b'NGIO ' * 1000)
+            # Big enough to go through the block-parallel _compress_large path
+            large = temp_dir / 'large.bin'
+            large.write_bytes(os.urandom(1 << 20) * 5)
+            
+            zip_path = temp_dir / 'roundtrip.zip'
+            members = [build_release._file_member(small, 'pkg/small.txt'),
+                       build_release._file_member(large, 'pkg/large.bin')]
+            build_release._parallel_zip(zip_path, members, {'pkg/README.txt': 'readme'})
+            
+            with zipfile.ZipFile(zip_path) as zipf:
+                bad = zipf.testzip()
+                if bad is not None:
+                    print(f"   ❌ Corrupt member: {bad}")
+                    return False
+                if (zipf.read('pkg/small.txt') != small.read_bytes()
+                        or zipf.read('pkg/large.bin') != large.read_bytes()):
+                    print("   ❌ Member contents differ from the source files")
+                    return False
+        
+        print("   ✅ Release ZIP passes testzip()")
+        return True
+    except Exception as e:
+        print(f"   ❌ Release ZIP error: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("=" * 80)
@@ -148,6 +224,8 @@ def main():
         ("Spec File", test_spec_file),
         ("Version Import", test_version_import),
         ("PyInstaller", test_pyinstaller),
+        ("UTF-16 INI Update", test_utf16_ini_update),
+        ("Release ZIP Round Trip", test_release_zip_roundtrip),
     ]
     
     results = {}